@@ -9,10 +9,12 @@ stages of a USD loading operation.
 import sys
 from pathlib import Path
 
+import numpy as np
+
 # Add project to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from tests.benchmarks.results import PerformanceTracker
+from tests.benchmarks.results import PerformanceTracker, SamplingTracker
 
 
 def example_basic_usage():
@@ -20,17 +22,17 @@ def example_basic_usage():
     print("EXAMPLE 1: Basic usage with automatic reporting\n")
 
     with PerformanceTracker(name="Basic Test", verbose=True) as tracker:
-        # Simulate some work
-        data = [i for i in range(1000000)]
-        tracker.probe("created_list")
+        # Simulate some work (1M int64 values, expect ~8 MB per array)
+        data = np.arange(1_000_000, dtype=np.int64)
+        tracker.probe("created_array")
 
         # More work
-        data_doubled = [x * 2 for x in data]
-        tracker.probe("doubled_list")
+        data_doubled = data * 2
+        tracker.probe("doubled_array")
 
         # Cleanup
         del data
-        tracker.probe("deleted_first_list")
+        tracker.probe("deleted_first_array")
 
     # Results are printed automatically
 
@@ -40,13 +42,13 @@ def example_manual_access():
     print("\n\nEXAMPLE 2: Manual access to probe data\n")
 
     with PerformanceTracker(name="Manual Test", verbose=False) as tracker:
-        data = [i for i in range(1000000)]
+        data = np.arange(1_000_000, dtype=np.int64)
         tracker.probe("step_1")
 
-        data2 = [x * 2 for x in data]
+        data2 = data * 2
         tracker.probe("step_2")
 
-    # Access results after completion
+    # Access results after completion; each step allocates ~8 MB
     print(f"Total probes recorded: {len(tracker.probes)}")
     for probe in tracker.probes:
         print(f"\nProbe: {probe.label}")
@@ -65,11 +67,12 @@ def example_cold_load_simulation():
     for i in range(3):
         print(f"Run {i + 1}:")
         with PerformanceTracker(name=f"Run {i + 1}", verbose=False) as tracker:
-            # Simulate loading
-            data = [i for i in range(500000)]
+            # Simulate loading (two ~4 MB arrays; later runs may reuse the
+            # memory freed by the previous run, so their deltas are smaller)
+            data = np.arange(500_000, dtype=np.int64)
             tracker.probe("load_step_1")
 
-            processed = [x * 2 for x in data]
+            processed = data * 2
             tracker.probe("load_step_2")
 
         if tracker.probes:
@@ -87,7 +90,25 @@ def example_cold_load_simulation():
     print(f"  Mean memory: {statistics.mean(memory_deltas) / (1024 * 1024):+.2f} MB")
 
 
+def example_sampling_zones():
+    """Attribute CPU time to zones without probing inside the loops."""
+    print("\n\nEXAMPLE 4: Sampling zones for hot loops\n")
+
+    with SamplingTracker(name="Sampling Test", verbose=True) as tracker:
+        with tracker.zone("build"):
+            data = [i for i in range(2000000)]
+
+        with tracker.zone("transform"):
+            total = 0
+            for x in data:
+                total += x * 2
+
+    # Results are printed automatically; per-zone CPU seconds are also
+    # available as tracker.zone_seconds
+
+
 if __name__ == "__main__":
     example_basic_usage()
     example_manual_access()
     example_cold_load_simulation()
+    example_sampling_zones()
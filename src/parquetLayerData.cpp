@@ -17,6 +17,27 @@
 
 PXR_NAMESPACE_OPEN_SCOPE
 
+namespace {
+
+// ReadBatch only returns values from the current data page, so a column
+// chunk that spans several pages has to be read in a loop. Only for
+// fixed-width types: BYTE_ARRAY values point into the page buffer, which
+// does not outlive the next page (see the BYTE_ARRAY branch of _LoadBlock).
+template <typename ReaderT, typename ValueT>
+int64_t _ReadColumnChunk(ReaderT& reader, int64_t numRows, ValueT* out) {
+    int64_t totalValuesRead = 0;
+    while (totalValuesRead < numRows && reader.HasNext()) {
+        int64_t valuesRead = 0;
+        reader.ReadBatch(numRows - totalValuesRead, nullptr, nullptr,
+                         out + totalValuesRead, &valuesRead);
+        if (valuesRead == 0) break;
+        totalValuesRead += valuesRead;
+    }
+    return totalValuesRead;
+}
+
+} // anonymous namespace
+
 ParquetLayerData::ParquetLayerData() {
 }
 
@@ -443,42 +464,49 @@ void ParquetLayerData::_LoadBlock(const TfToken& field, int rowGroup) const {
     if (colReader->type() == parquet::Type::FLOAT) {
         auto floatReader = std::static_pointer_cast<parquet::FloatReader>(colReader);
         VtArray<float> data(rowsInGroup);
-        int64_t valuesRead = 0;
-        floatReader->ReadBatch(rowsInGroup, nullptr, nullptr, data.data(), &valuesRead);
+        _ReadColumnChunk(*floatReader, rowsInGroup, data.data());
         _blockCache[field][rowGroup] = VtValue(data);
     } else if (colReader->type() == parquet::Type::DOUBLE) {
         auto doubleReader = std::static_pointer_cast<parquet::DoubleReader>(colReader);
         VtArray<double> data(rowsInGroup);
-        int64_t valuesRead = 0;
-        doubleReader->ReadBatch(rowsInGroup, nullptr, nullptr, data.data(), &valuesRead);
+        _ReadColumnChunk(*doubleReader, rowsInGroup, data.data());
         _blockCache[field][rowGroup] = VtValue(data);
     } else if (colReader->type() == parquet::Type::INT32) {
         auto intReader = std::static_pointer_cast<parquet::Int32Reader>(colReader);
         VtArray<int> data(rowsInGroup);
-        int64_t valuesRead = 0;
-        intReader->ReadBatch(rowsInGroup, nullptr, nullptr, data.data(), &valuesRead);
+        _ReadColumnChunk(*intReader, rowsInGroup, data.data());
         _blockCache[field][rowGroup] = VtValue(data);
     } else if (colReader->type() == parquet::Type::INT64) {
         auto int64Reader = std::static_pointer_cast<parquet::Int64Reader>(colReader);
         VtArray<int64_t> data(rowsInGroup);
-        int64_t valuesRead = 0;
-        int64Reader->ReadBatch(rowsInGroup, nullptr, nullptr, data.data(), &valuesRead);
+        _ReadColumnChunk(*int64Reader, rowsInGroup, data.data());
         _blockCache[field][rowGroup] = VtValue(data);
     } else if (colReader->type() == parquet::Type::BOOLEAN) {
         auto boolReader = std::static_pointer_cast<parquet::BoolReader>(colReader);
         VtArray<bool> data(rowsInGroup);
-        int64_t valuesRead = 0;
-        boolReader->ReadBatch(rowsInGroup, nullptr, nullptr, data.data(), &valuesRead);
+        _ReadColumnChunk(*boolReader, rowsInGroup, data.data());
         _blockCache[field][rowGroup] = VtValue(data);
     } else if (colReader->type() == parquet::Type::BYTE_ARRAY) {
         auto stringReader = std::static_pointer_cast<parquet::ByteArrayReader>(colReader);
+        // ByteArray values point into the current page's buffer, which is
+        // released when the next page loads, so copy each batch before the
+        // next ReadBatch (_ReadColumnChunk is only safe for fixed-width types)
         std::vector<parquet::ByteArray> rawData(rowsInGroup);
-        int64_t valuesRead = 0;
-        stringReader->ReadBatch(rowsInGroup, nullptr, nullptr, rawData.data(), &valuesRead);
-        VtArray<std::string> data(valuesRead);
-        for (int64_t i = 0; i < valuesRead; ++i) {
-            data[i] = std::string(reinterpret_cast<const char*>(rawData[i].ptr), rawData[i].len);
+        VtArray<std::string> data(rowsInGroup);
+        int64_t totalValuesRead = 0;
+        while (totalValuesRead < rowsInGroup && stringReader->HasNext()) {
+            int64_t valuesRead = 0;
+            stringReader->ReadBatch(rowsInGroup - totalValuesRead, nullptr, nullptr,
+                                    rawData.data(), &valuesRead);
+            if (valuesRead == 0) break;
+
+            for (int64_t i = 0; i < valuesRead; ++i) {
+                data[totalValuesRead + i] = std::string(
+                    reinterpret_cast<const char*>(rawData[i].ptr), rawData[i].len);
+            }
+            totalValuesRead += valuesRead;
         }
+        data.resize(totalValuesRead);
         _blockCache[field][rowGroup] = VtValue(data);
     }
 }
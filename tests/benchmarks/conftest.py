@@ -2,12 +2,18 @@
 Pytest configuration and fixtures for benchmark tests.
 """
 
+import os
 from pathlib import Path
 
 import pytest
-from pxr import Plug
+from pxr import Plug, Sdf
 
-from .results import ResultCollector, set_collector
+from .results import (
+    PARALLEL_RUNS_ENV,
+    PROBE_MODE_ENV,
+    ResultCollector,
+    set_collector,
+)
 
 # Default test configuration
 DEFAULT_SCALE = 1000
@@ -27,6 +33,47 @@ TEST_PROPERTIES = [
     "supplier_id",
 ]
 
+# Name of the USD file format plugin under test
+PLUGIN_NAME = "parquetFormat"
+
+# Set once the plugin has been loaded in this process
+_plugin_loaded = False
+
+
+def _ensure_plugin_loaded() -> None:
+    """Load the parquet plugin once per process, failing fast if it is missing."""
+    global _plugin_loaded
+    if _plugin_loaded:
+        return
+
+    plugin = Plug.Registry().GetPluginWithName(PLUGIN_NAME)
+    assert plugin is not None, (
+        f"USD plugin '{PLUGIN_NAME}' not found; check PXR_PLUGINPATH_NAME"
+    )
+    if not plugin.isLoaded:
+        plugin.Load()
+    _plugin_loaded = True
+
+
+def ensure_session_cached(data_dir: Path) -> None:
+    """
+    Read every benchmark input once so the first measured test does not pay
+    the cold page-cache cost that later tests skip.
+
+    This only warms the OS page cache. Layers are deliberately not opened
+    here: a layer held by this process would sit in the layer registry and be
+    inherited by the forked benchmark workers, hiding the load being measured.
+    """
+    for path in sorted(data_dir.glob("*.parquet")) + [
+        data_dir / "base_scene.usda",
+        data_dir / USDC_FORMAT,
+    ]:
+        if not path.exists():
+            continue
+        with open(path, "rb", buffering=0) as f:
+            while f.read(1 << 20):
+                pass
+
 
 def pytest_addoption(parser):
     """Add command line options for benchmark configuration."""
@@ -43,6 +90,36 @@ def pytest_addoption(parser):
         choices=["flat", "deep"],
         help="Hierarchy pattern",
     )
+    parser.addoption(
+        "--benchmark-cache",
+        type=str,
+        default="warm",
+        choices=["warm", "cold"],
+        help="Page cache state for load benchmarks: warm (inputs read once "
+        "per session) or cold (inputs evicted before every run, Linux only)",
+    )
+    parser.addoption(
+        "--detailed-probes",
+        action="store_true",
+        default=False,
+        help="Record interior progress probes during traversals "
+        f"(same as {PROBE_MODE_ENV}=detail)",
+    )
+    parser.addoption(
+        "--parallel-runs",
+        action="store_true",
+        default=False,
+        help="Overlap the isolated runs of each single-property benchmark; "
+        f"faster, but timings are not comparable (same as {PARALLEL_RUNS_ENV}=1)",
+    )
+
+
+def pytest_configure(config):
+    """Export the probe and run modes so benchmark worker processes inherit them."""
+    if config.getoption("--detailed-probes"):
+        os.environ[PROBE_MODE_ENV] = "detail"
+    if config.getoption("--parallel-runs"):
+        os.environ[PARALLEL_RUNS_ENV] = "1"
 
 
 @pytest.fixture(scope="session")
@@ -57,6 +134,12 @@ def benchmark_hierarchy(request) -> str:
     return request.config.getoption("--benchmark-hierarchy")
 
 
+@pytest.fixture(scope="session")
+def benchmark_cache(request) -> str:
+    """Get the page cache mode (warm or cold) from command line."""
+    return request.config.getoption("--benchmark-cache")
+
+
 @pytest.fixture(scope="session")
 def data_dir(benchmark_scale, benchmark_hierarchy) -> Path:
     """Get the data directory for the current test configuration."""
@@ -67,20 +150,23 @@ def data_dir(benchmark_scale, benchmark_hierarchy) -> Path:
 @pytest.fixture(scope="session", autouse=True)
 def ensure_plugin_loaded():
     """Ensure the parquet plugin is loaded before tests."""
-    plugin = Plug.Registry().GetPluginWithName("parquetFormat")
-    if plugin and not plugin.isLoaded:
-        plugin.Load()
+    _ensure_plugin_loaded()
 
 
 @pytest.fixture(scope="session")
 def result_collector(benchmark_scale, benchmark_hierarchy, data_dir) -> ResultCollector:
     """Create and set up the global result collector."""
     collector = ResultCollector(scale=benchmark_scale, hierarchy=benchmark_hierarchy)
+    ensure_session_cached(data_dir)
+    # Stream results as they arrive so a crash mid-session keeps them
+    collector.open_stream(data_dir / "benchmark_results.ndjson")
     set_collector(collector)
     yield collector
-    # Save results at end of session
-    output_path = data_dir / "benchmark_results.json"
-    collector.save_json(output_path)
+    collector.close_stream()
+    # Save results at end of session: probes go to Parquet, the summary
+    # (which report.py consumes) stays in JSON
+    collector.save_parquet(data_dir / "benchmark_probes.parquet")
+    collector.save_json(data_dir / "benchmark_results.json")
 
 
 @pytest.fixture(scope="session")
@@ -92,6 +178,19 @@ def base_scene_path(data_dir) -> Path:
     return path
 
 
+@pytest.fixture(scope="class")
+def resident_base_layer(base_scene_path):
+    """Keep the base scene layer open for the tests of one class.
+
+    Sdf's layer registry then serves every stage those tests build from the
+    already parsed layer instead of re-reading the base scene. Only use it
+    where opening the stage is not timed; the layer is released when the
+    class finishes so later forked workers that time the load never inherit
+    it (see ensure_session_cached).
+    """
+    yield Sdf.Layer.FindOrOpen(str(base_scene_path))
+
+
 @pytest.fixture(params=PARQUET_COMPRESSIONS + ["usdc"])
 def property_file(request, data_dir, benchmark_scale) -> tuple[str, Path]:
     """
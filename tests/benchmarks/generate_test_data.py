@@ -3,82 +3,164 @@
 Generate test data for Parquet vs USDC benchmarks.
 
 By default, existing files are preserved to speed up development iteration.
-Use --force to regenerate all files.
+Use --force to rewrite all files from the cached table, or --regenerate-data
+to also redraw the random data.
 
 Usage:
     uv run python tests/benchmarks/generate_test_data.py --scale 1000 --hierarchy flat
     uv run python tests/benchmarks/generate_test_data.py --scale 1000 --hierarchy flat --force
+    uv run python tests/benchmarks/generate_test_data.py --scale 1000 --hierarchy flat --regenerate-data
 """
 
 import argparse
 import os
-import random
-import re
 import string
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
 import numpy as np
-import pandas as pd
 import pyarrow as pa
+import pyarrow.feather as feather
 import pyarrow.parquet as pq
 
+# Shared random generator for every column; reseeded from --seed in main()
+DEFAULT_SEED = 0
+_RNG = np.random.default_rng(DEFAULT_SEED)
+
+
+def seed_generators(seed: int) -> None:
+    """Reset the shared random generator so generated data is reproducible."""
+    global _RNG
+    _RNG = np.random.default_rng(seed)
+
+
+# Byte lookup tables for vectorized random string generation
+_UPPERCASE = np.frombuffer(string.ascii_uppercase.encode("ascii"), dtype=np.uint8)
+_ALPHANUMERIC = np.frombuffer(
+    (string.ascii_letters + string.digits).encode("ascii"), dtype=np.uint8
+)
+
+
+def _random_strings(n: int, alphabet: np.ndarray, length: int) -> np.ndarray:
+    """Draw n fixed-length byte strings from alphabet in a single vectorized pass."""
+    codes = _RNG.integers(0, len(alphabet), size=(n, length), dtype=np.uint8)
+    return alphabet[codes].view(f"S{length}").ravel()
+
+
+def _supplier_ids(n: int) -> np.ndarray:
+    """Generate supplier ids like 'SUP-1234'."""
+    return np.char.add("SUP-", _RNG.integers(1000, 10000, n).astype("U4"))
+
+
+def _material_codes(n: int) -> np.ndarray:
+    """Generate material codes like 'ABC-123'."""
+    letters = _random_strings(n, _UPPERCASE, 3).astype("U3")
+    return np.char.add(
+        np.char.add(letters, "-"), _RNG.integers(100, 1000, n).astype("U3")
+    )
+
+
+def _install_dates(n: int) -> np.ndarray:
+    """Generate ISO dates between 2020 and 2025 (day capped at 28)."""
+    years = _RNG.integers(2020, 2026, n).astype("U4")
+    months = np.char.zfill(_RNG.integers(1, 13, n).astype("U2"), 2)
+    days = np.char.zfill(_RNG.integers(1, 29, n).astype("U2"), 2)
+    return np.char.add(np.char.add(np.char.add(years, "-"), months), "-" + days)
+
+
+def _payloads(n: int, length: int = 1000) -> pa.Array:
+    """Generate fixed-length alphanumeric payload strings.
+
+    The random bytes become the Arrow string data buffer as-is: with fixed
+    length strings the offsets are just a stride, so no per-row string
+    objects or copies are created.
+    """
+    raw = _random_strings(n, _ALPHANUMERIC, length)
+    offsets = np.arange(0, (n + 1) * length, length, dtype=np.int32)
+    return pa.StringArray.from_buffers(
+        n, pa.py_buffer(offsets), pa.py_buffer(raw)
+    )
+
+
 # Property definitions matching benchmark_spec.md
 PROPERTIES = {
     # Doubles (14)
-    "cost": ("double", lambda n: np.random.uniform(100, 10000, n)),
-    "carbon_A1": ("double", lambda n: np.random.uniform(0, 100, n)),
-    "carbon_A2": ("double", lambda n: np.random.uniform(0, 50, n)),
-    "carbon_A3": ("double", lambda n: np.random.uniform(0, 200, n)),
-    "carbon_A4": ("double", lambda n: np.random.uniform(0, 30, n)),
-    "carbon_A5": ("double", lambda n: np.random.uniform(0, 20, n)),
-    "weight": ("double", lambda n: np.random.uniform(1, 1000, n)),
-    "temperature": ("double", lambda n: np.random.uniform(-20, 60, n)),
-    "pressure": ("double", lambda n: np.random.uniform(90000, 110000, n)),
-    "velocity_x": ("double", lambda n: np.random.normal(0, 1, n)),
-    "velocity_y": ("double", lambda n: np.random.normal(0, 1, n)),
-    "velocity_z": ("double", lambda n: np.random.normal(0, 1, n)),
-    "stress": ("double", lambda n: np.random.uniform(0, 500, n)),
-    "strain": ("double", lambda n: np.random.uniform(0, 0.01, n)),
-    "efficiency": ("double", lambda n: np.random.uniform(0.5, 1.0, n)),
+    "cost": ("double", lambda n: _RNG.uniform(100, 10000, n)),
+    "carbon_A1": ("double", lambda n: _RNG.uniform(0, 100, n)),
+    "carbon_A2": ("double", lambda n: _RNG.uniform(0, 50, n)),
+    "carbon_A3": ("double", lambda n: _RNG.uniform(0, 200, n)),
+    "carbon_A4": ("double", lambda n: _RNG.uniform(0, 30, n)),
+    "carbon_A5": ("double", lambda n: _RNG.uniform(0, 20, n)),
+    "weight": ("double", lambda n: _RNG.uniform(1, 1000, n)),
+    "temperature": ("double", lambda n: _RNG.uniform(-20, 60, n)),
+    "pressure": ("double", lambda n: _RNG.uniform(90000, 110000, n)),
+    "velocity_x": ("double", lambda n: _RNG.normal(0, 1, n)),
+    "velocity_y": ("double", lambda n: _RNG.normal(0, 1, n)),
+    "velocity_z": ("double", lambda n: _RNG.normal(0, 1, n)),
+    "stress": ("double", lambda n: _RNG.uniform(0, 500, n)),
+    "strain": ("double", lambda n: _RNG.uniform(0, 0.01, n)),
+    "efficiency": ("double", lambda n: _RNG.uniform(0.5, 1.0, n)),
     # Int (1)
-    "lifespan": ("int", lambda n: np.random.randint(1, 50, n)),
+    "lifespan": ("int", lambda n: _RNG.integers(1, 50, n)),
     # Bool (1)
-    "is_active": ("bool", lambda n: np.random.choice([True, False], n)),
+    "is_active": ("bool", lambda n: _RNG.choice([True, False], n)),
     # Strings (4)
-    "supplier_id": (
-        "string",
-        lambda n: [f"SUP-{random.randint(1000, 9999)}" for _ in range(n)],
-    ),
-    "material_code": (
-        "string",
-        lambda n: [
-            "".join(random.choices(string.ascii_uppercase, k=3))
-            + "-"
-            + str(random.randint(100, 999))
-            for _ in range(n)
-        ],
-    ),
-    "install_date": (
-        "string",
-        lambda n: [
-            f"20{random.randint(20, 25):02d}-{random.randint(1, 12):02d}-{random.randint(1, 28):02d}"
-            for _ in range(n)
-        ],
-    ),
+    "supplier_id": ("string", _supplier_ids),
+    "material_code": ("string", _material_codes),
+    "install_date": ("string", _install_dates),
     # Large payload for memory testing (1KB per prim) - random characters
-    "payload": (
-        "string",
-        lambda n: [
-            "".join(random.choices(string.ascii_letters + string.digits, k=1000))
-            for _ in range(n)
-        ],
-    ),
+    "payload": ("string", _payloads),
 }
 
+# Uncompressed Arrow IPC cache of the generated table, kept in the output dir
+TABLE_CACHE = "_table.arrow"
+
+# Arrow storage type for each of our type names
+_ARROW_TYPES = {
+    "double": pa.float64(),
+    "int": pa.int64(),
+    "bool": pa.bool_(),
+    "string": pa.string(),
+}
+
+# Schema of the generated table: the 'path' column followed by all properties
+TABLE_SCHEMA = pa.schema(
+    [("path", pa.string())]
+    + [(name, _ARROW_TYPES[type_name]) for name, (type_name, _) in PROPERTIES.items()]
+)
+
 # Parquet configurations to test
 COMPRESSIONS = ["ZSTD"]
 ROW_GROUP_SIZES = [100, 1000, 10000]
 
+# Low-cardinality columns worth dictionary-encoding; high-cardinality ones
+# (path, payload, the random doubles) only pay for a dictionary that the
+# writer later abandons
+DICTIONARY_COLUMNS = [
+    "lifespan",
+    "is_active",
+    "supplier_id",
+    "material_code",
+    "install_date",
+]
+
+
+def default_row_group_size(n: int) -> int:
+    """Row group size scaled to the row count.
+
+    Keeps the number of row groups (and thus footer size and per-group seeks)
+    bounded at large scales while never going below 1024 rows.
+    """
+    return max(1024, n // 64)
+
+
+def expected_files(scale: int) -> list[str]:
+    """Names of the files a complete configuration directory contains."""
+    return ["base_scene.usda", "properties.usdc"] + [
+        f"properties_{compression.lower()}_{scale}.parquet"
+        for compression in COMPRESSIONS
+    ]
+
 
 def generate_paths(n: int, hierarchy: str) -> list[str]:
     """Generate prim paths based on hierarchy pattern."""
@@ -119,26 +201,33 @@ def generate_paths(n: int, hierarchy: str) -> list[str]:
         raise ValueError(f"Unknown hierarchy: {hierarchy}")
 
 
-def generate_dataframe(n: int, hierarchy: str) -> pd.DataFrame:
-    """Generate a DataFrame with all properties."""
-    print(f"Generating DataFrame with {n} rows...")
+def generate_table(n: int, hierarchy: str) -> pa.Table:
+    """Generate an Arrow table with all properties.
+
+    Each column is converted to Arrow as soon as it is generated and the
+    intermediate buffer released, so peak memory stays close to the size of
+    the final table.
+    """
+    print(f"Generating table with {n} rows...")
 
-    data = {"path": generate_paths(n, hierarchy)}
+    arrays = [pa.array(generate_paths(n, hierarchy), type=pa.string())]
 
-    for prop_name, (_, generator) in PROPERTIES.items():
-        data[prop_name] = generator(n)
+    for type_name, generator in PROPERTIES.values():
+        column = generator(n)
+        arrays.append(pa.array(column, type=_ARROW_TYPES[type_name]))
+        del column
 
-    return pd.DataFrame(data)
+    return pa.Table.from_arrays(arrays, schema=TABLE_SCHEMA)
 
 
 def write_parquet(
-    df: pd.DataFrame,
+    table: pa.Table,
     output_path: Path,
     compression: str,
     row_group_size: int,
     force: bool = False,
 ) -> bool:
-    """Write DataFrame to Parquet with specified settings.
+    """Write table to Parquet with specified settings.
 
     Returns True if file was written, False if skipped (already exists).
     """
@@ -147,20 +236,21 @@ def write_parquet(
         print(f"  Skipped: {output_path.name} ({size_mb:.2f} MB) - already exists")
         return False
 
-    table = pa.Table.from_pandas(df, preserve_index=False)
     pq.write_table(
         table,
         output_path,
         compression=compression if compression != "NONE" else None,
         row_group_size=row_group_size,
+        data_page_size=1 << 20,
+        use_dictionary=DICTIONARY_COLUMNS,
     )
     size_mb = output_path.stat().st_size / (1024 * 1024)
     print(f"  Written: {output_path.name} ({size_mb:.2f} MB)")
     return True
 
 
-def write_usdc(df: pd.DataFrame, output_path: Path, force: bool = False) -> bool:
-    """Write DataFrame as a USDC layer with 'over' prims.
+def write_usdc(table: pa.Table, output_path: Path, force: bool = False) -> bool:
+    """Write table as a USDC layer with 'over' prims.
 
     Returns True if file was written, False if skipped (already exists).
     """
@@ -174,27 +264,29 @@ def write_usdc(df: pd.DataFrame, output_path: Path, force: bool = False) -> bool
     # Create layer
     layer = Sdf.Layer.CreateNew(str(output_path))
 
-    for _, row in df.iterrows():
-        path = row["path"]
-        prim_path = Sdf.Path(path)
-
-        # Create prim spec as 'over'
-        prim_spec = Sdf.CreatePrimInLayer(layer, prim_path)
-        prim_spec.specifier = Sdf.SpecifierOver
-
-        # Add attributes
-        for prop_name, (type_name, _) in PROPERTIES.items():
-            value = row[prop_name]
-
-            # Create attribute spec
-            attr_spec = Sdf.AttributeSpec(
-                prim_spec,
-                prop_name,
-                Sdf.ValueTypeNames.Find(_get_sdf_type_name(type_name)),
-            )
-
-            # Set default value
-            attr_spec.default = _convert_value(value, type_name)
+    # Resolve value types and converters once per column, not per cell
+    columns = [
+        (
+            prop_name,
+            Sdf.ValueTypeNames.Find(_get_sdf_type_name(type_name)),
+            _CONVERTERS[type_name],
+        )
+        for prop_name, (type_name, _) in PROPERTIES.items()
+    ]
+    column_arrays = [table.column(prop_name).to_numpy() for prop_name in PROPERTIES]
+
+    # Defer change notification until all specs exist
+    with Sdf.ChangeBlock():
+        prim_paths = _iter_sdf_paths(table.column("path").to_numpy())
+        for prim_path, *values in zip(prim_paths, *column_arrays):
+            # Create prim spec as 'over'
+            prim_spec = Sdf.CreatePrimInLayer(layer, prim_path)
+            prim_spec.specifier = Sdf.SpecifierOver
+
+            # Add attributes with their default values
+            for (prop_name, sdf_type, convert), value in zip(columns, values):
+                attr_spec = Sdf.AttributeSpec(prim_spec, prop_name, sdf_type)
+                attr_spec.default = convert(value)
 
     layer.Save()
     size_mb = output_path.stat().st_size / (1024 * 1024)
@@ -202,6 +294,24 @@ def write_usdc(df: pd.DataFrame, output_path: Path, force: bool = False) -> bool
     return True
 
 
+def _iter_sdf_paths(paths):
+    """Yield an Sdf.Path for each absolute prim path string.
+
+    Only the parent part of each path is parsed, once per distinct parent;
+    the leaf is appended with AppendChild. Sibling prims (all of /World in
+    the flat hierarchy, each Room in the deep one) share the parsed parent.
+    """
+    from pxr import Sdf
+
+    parents = {}
+    for path in paths:
+        parent, _, name = path.rpartition("/")
+        parent_path = parents.get(parent)
+        if parent_path is None:
+            parent_path = parents[parent] = Sdf.Path(parent or "/")
+        yield parent_path.AppendChild(name)
+
+
 def _get_sdf_type_name(type_name: str) -> str:
     """Map our type names to SDF type names."""
     mapping = {
@@ -213,17 +323,13 @@ def _get_sdf_type_name(type_name: str) -> str:
     return mapping[type_name]
 
 
-def _convert_value(value, type_name: str):
-    """Convert numpy/python values to USD-compatible values."""
-    if type_name == "double":
-        return float(value)
-    elif type_name == "int":
-        return int(value)
-    elif type_name == "bool":
-        return bool(value)
-    elif type_name == "string":
-        return str(value)
-    return value
+# Per-type conversion of numpy/python values to USD-compatible values
+_CONVERTERS = {
+    "double": float,
+    "int": int,
+    "bool": bool,
+    "string": str,
+}
 
 
 def write_base_usda(paths: list[str], output_path: Path, force: bool = False) -> bool:
@@ -245,17 +351,40 @@ def write_base_usda(paths: list[str], output_path: Path, force: bool = False) ->
     root_prim.specifier = Sdf.SpecifierDef
     root_prim.typeName = "Xform"
 
-    for path in paths:
-        prim_path = Sdf.Path(path)
-        prim_spec = Sdf.CreatePrimInLayer(layer, prim_path)
-        prim_spec.specifier = Sdf.SpecifierDef
-        prim_spec.typeName = "Xform"
+    # Defer change notification until all specs exist
+    with Sdf.ChangeBlock():
+        for prim_path in _iter_sdf_paths(paths):
+            prim_spec = Sdf.CreatePrimInLayer(layer, prim_path)
+            prim_spec.specifier = Sdf.SpecifierDef
+            prim_spec.typeName = "Xform"
+
+            # CreatePrimInLayer adds missing ancestors (e.g. Zone/Level/Room in
+            # the deep hierarchy) as 'over'; define them so they compose as prims
+            parent = prim_spec.nameParent
+            while (
+                parent.path != Sdf.Path.absoluteRootPath
+                and parent.specifier == Sdf.SpecifierOver
+            ):
+                parent.specifier = Sdf.SpecifierDef
+                parent = parent.nameParent
 
     layer.Save()
     print(f"  Written: {output_path.name}")
     return True
 
 
+def _write_base_usda_from_file(table_path: Path, output_path: Path, force: bool) -> bool:
+    """Process-pool entry point: read paths from the shared table file."""
+    table = feather.read_table(table_path, columns=["path"], memory_map=True)
+    return write_base_usda(table.column("path").to_pylist(), output_path, force)
+
+
+def _write_usdc_from_file(table_path: Path, output_path: Path, force: bool) -> bool:
+    """Process-pool entry point: memory-map the shared table and write USDC."""
+    table = feather.read_table(table_path, memory_map=True)
+    return write_usdc(table, output_path, force)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Generate benchmark test data")
     parser.add_argument(
@@ -283,81 +412,138 @@ def main():
         action="store_true",
         help="Force regeneration of existing files",
     )
+    parser.add_argument(
+        "--regenerate-data",
+        action="store_true",
+        help="Regenerate the random data instead of reusing the cached table "
+        "(implies --force)",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=DEFAULT_SEED,
+        help=f"Random seed for the generated data (default: {DEFAULT_SEED})",
+    )
+    parser.add_argument(
+        "--row-group-size",
+        type=int,
+        default=None,
+        help="Parquet row group size (default: max(1024, scale // 64); "
+        "use a small value such as 50 to see progressive loading)",
+    )
     args = parser.parse_args()
+    generate(
+        args.scale,
+        args.hierarchy,
+        output_dir=args.output_dir,
+        force=args.force,
+        regenerate_data=args.regenerate_data,
+        seed=args.seed,
+        row_group_size=args.row_group_size,
+    )
+
+
+def generate(
+    scale: int,
+    hierarchy: str,
+    output_dir: str | Path = "tests/data/benchmarks",
+    force: bool = False,
+    regenerate_data: bool = False,
+    seed: int = DEFAULT_SEED,
+    row_group_size: int | None = None,
+) -> bool:
+    """Generate the data for one configuration; the in-process form of main().
+
+    Takes the same settings as the command line options and returns True
+    once every file exists (generated now or already present).
+    """
+    if regenerate_data:
+        force = True
+    row_group_size = row_group_size or default_row_group_size(scale)
 
     # Create output directory
-    output_dir = Path(args.output_dir) / f"{args.scale}_{args.hierarchy}"
+    output_dir = Path(output_dir) / f"{scale}_{hierarchy}"
     output_dir.mkdir(parents=True, exist_ok=True)
     print(f"Output directory: {output_dir}")
 
-    if args.force:
+    if force:
         print("Force mode: Will regenerate all files")
     else:
         print("Incremental mode: Will skip existing files (use --force to regenerate)")
 
     # Check if we need to generate data at all
-    needs_generation = args.force
+    needs_generation = force
     if not needs_generation:
         # Check if any required files are missing
-        base_path = output_dir / "base_scene.usda"
-        usdc_path = output_dir / "properties.usdc"
-        required_files = [base_path, usdc_path]
-
-        for compression in COMPRESSIONS:
-            filename = f"properties_{compression.lower()}_{args.scale}.parquet"
-            required_files.append(output_dir / filename)
-
-        for file_path in required_files:
-            if not file_path.exists():
-                needs_generation = True
-                break
+        needs_generation = not all(
+            (output_dir / filename).exists() for filename in expected_files(scale)
+        )
 
     if not needs_generation:
         print("\n✓ All files already exist. Skipping generation.")
         print("  Use --force to regenerate.")
-        return
-
-    # Generate data only if needed
-    print(f"\nGenerating DataFrame with {args.scale} rows...")
-    df = generate_dataframe(args.scale, args.hierarchy)
-
-    # Write base USDA (hierarchy only)
-    print("\nWriting base USDA...")
-    base_path = output_dir / "base_scene.usda"
-    write_base_usda(df["path"].tolist(), base_path, args.force)
-
-    # Replace all occurrences of the word 'over' with 'def' in the USDA file
-    # yes, I know this is a dirty hack
-    print("\nPost-processing USDA: replacing 'over' with 'def'...")
-    try:
-        original = base_path.read_text(encoding="utf-8")
-        updated, count = re.subn(r"\bover\b", "def", original)
-        if count > 0:
-            base_path.write_text(updated, encoding="utf-8")
-            print(f"  Replaced {count} occurrence(s) in {base_path.name}")
+        return True
+
+    # Reuse the cached table if there is one, so --force only rewrites the
+    # output files instead of redrawing all the random data
+    # (the cache records its seed, so a different --seed regenerates)
+    table_path = output_dir / TABLE_CACHE
+    seed_metadata = {b"seed": str(seed).encode()}
+    table = None
+    if table_path.exists() and not regenerate_data:
+        cached = feather.read_table(table_path, memory_map=True)
+        if cached.schema.metadata == seed_metadata:
+            print(f"\nLoading cached table from {table_path.name}...")
+            table = cached
         else:
-            print("  No 'over' occurrences found in USDA")
-    except Exception as e:
-        print(f"  Warning: failed to update {base_path.name}: {e}")
-
-    # Write Parquet variants
-    print("\nWriting Parquet files...")
-    written_count = 0
-    for compression in COMPRESSIONS:
-        filename = f"properties_{compression.lower()}_{args.scale}.parquet"
-        # Use smaller row groups to see progressive loading effect
-        if write_parquet(df, output_dir / filename, compression, 50, args.force):
-            written_count += 1
-
-    # Write USDC
-    print("\nWriting USDC file...")
-    write_usdc(df, output_dir / "properties.usdc", args.force)
+            print("\nCached table was generated with a different seed")
+            # Force all outputs to be rewritten from the new data
+            force = True
+
+    if table is None:
+        print(f"\nGenerating table with {scale} rows (seed {seed})...")
+        seed_generators(seed)
+        table = generate_table(scale, hierarchy)
+        table = table.replace_schema_metadata(seed_metadata)
+        feather.write_feather(table, table_path, compression="uncompressed")
+
+    # The outputs are independent, so write them concurrently: the USD
+    # writers are Python-bound and get their own processes (reading the
+    # cached table via memory map instead of pickling it), while the
+    # Parquet writers run on threads since Arrow releases the GIL.
+    print("\nWriting base USDA, Parquet and USDC files...")
+    base_path = output_dir / "base_scene.usda"
+    usdc_path = output_dir / "properties.usdc"
+
+    with (
+        ProcessPoolExecutor(max_workers=2) as processes,
+        ThreadPoolExecutor(max_workers=len(COMPRESSIONS)) as threads,
+    ):
+        usd_futures = [
+            processes.submit(_write_base_usda_from_file, table_path, base_path, force),
+            processes.submit(_write_usdc_from_file, table_path, usdc_path, force),
+        ]
+        parquet_futures = [
+            threads.submit(
+                write_parquet,
+                table,
+                output_dir / f"properties_{compression.lower()}_{scale}.parquet",
+                compression,
+                row_group_size,
+                force,
+            )
+            for compression in COMPRESSIONS
+        ]
+
+        written_count = sum(future.result() for future in parquet_futures)
+        for future in usd_futures:
+            future.result()
 
     print(f"\n✓ Done! Output in {output_dir}")
-    if not args.force and written_count < len(COMPRESSIONS):
-        print(
-            f"  ({len(COMPRESSIONS) - written_count} file(s) were skipped - already exist)"
-        )
+    skipped_count = len(parquet_futures) - written_count
+    if not force and skipped_count:
+        print(f"  ({skipped_count} file(s) were skipped - already exist)")
+    return True
 
 
 if __name__ == "__main__":
@@ -9,937 +9,445 @@ Usage:
 """
 
 import argparse
+import gzip
+import hashlib
+import io
 import json
+import os
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from importlib import resources
 from pathlib import Path
+from typing import NamedTuple
 
+import numpy as np
+from jinja2 import Environment, FileSystemLoader
 
-def generate_tab_content(test_name, results, data):
-    """Generate content for a specific test tab."""
-    test_results = [r for r in results if r["test"] == test_name]
+# Try to import orjson for faster serialization of the embedded data
+try:
+    import orjson
 
-    if not test_results:
-        return f"""
-        <div class="card">
-            <p>No results available for {test_name}</p>
-        </div>
-        """
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
-    # Generate comparison table
-    table_rows = []
-    for r in test_results:
-        format_class = "badge-usdc" if r["format"] == "usdc" else "badge-parquet"
-        mean = f"{r['mean_seconds'] * 1000:.2f} ms" if r.get("mean_seconds") else "-"
-        std = f"±{r['std_seconds'] * 1000:.2f} ms" if r.get("std_seconds") else "-"
-        memory = (
-            f"{r.get('peak_memory_bytes', 0) / (1024 * 1024):.2f} MB"
-            if r.get("peak_memory_bytes")
-            else "-"
+# Badge CSS class per format; every Parquet variant shares the default
+BADGE_CLASS = {"usdc": "badge-usdc"}
+DEFAULT_BADGE = "badge-parquet"
+
+# Bytes to megabytes, as a multiplier
+INV_MB = 1.0 / (1024 * 1024)
+
+# Tests whose results feed the load speed metric on the overview tab
+_INITIAL_LOAD_TESTS = frozenset({"initial_load", "initial_load_cold"})
+
+
+def _dumps(obj) -> str:
+    """Serialize to compact JSON for embedding, with orjson when available."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def _badge_class(format_name: str) -> str:
+    """CSS badge class for a format name."""
+    return BADGE_CLASS.get(format_name, DEFAULT_BADGE)
+
+
+def _to_mb(num_bytes) -> float:
+    """Convert a byte count (or None) to megabytes."""
+    return (num_bytes or 0) * INV_MB
+
+
+# Thousands-grouped strings by value; prim counts and sizes repeat across rows
+_fmt_int_cache: dict[int, str] = {}
+
+
+def fmt_int(n: int) -> str:
+    """Format an integer with thousands separators, reusing earlier results."""
+    s = _fmt_int_cache.get(n)
+    if s is None:
+        s = _fmt_int_cache[n] = format(n, ",d")
+    return s
+
+
+# Optional fields summarised in a results column, as (key, formatter) pairs
+TAB_DETAILS = (
+    ("prim_count", lambda n: fmt_int(n) + " prims"),
+    ("time_per_prim_us", "%.2f µs/prim".__mod__),
+    ("property_count", "%s props".__mod__),
+)
+RESULT_EXTRAS = (
+    ("prim_count", lambda n: fmt_int(n) + " prims"),
+    ("time_per_prim_us", "%.2f µs/prim".__mod__),
+    ("size_mb", "%.2f MB".__mod__),
+    ("num_row_groups", "%s row groups".__mod__),
+)
+
+
+def format_details(r: dict, fields) -> str:
+    """Join the formatted fields that are set on a result, or "-" if none are."""
+    get = r.get
+    return ", ".join([fmt(v) for key, fmt in fields if (v := get(key))]) or "-"
+
+
+# Section templates, compiled once at import
+_TEMPLATE_ENV = Environment(
+    loader=FileSystemLoader(Path(__file__).parent / "report_templates"),
+    auto_reload=False,
+    trim_blocks=True,
+    lstrip_blocks=True,
+)
+_TEMPLATE_ENV.filters["badge"] = _badge_class
+_TEMPLATE_ENV.filters["mb"] = _to_mb
+_TEMPLATE_ENV.filters["thousands"] = fmt_int
+_TAB_TEMPLATE = _TEMPLATE_ENV.get_template("tab.html.j2")
+_OVERVIEW_TEMPLATE = _TEMPLATE_ENV.get_template("overview.html.j2")
+_FILE_SIZE_TEMPLATE = _TEMPLATE_ENV.get_template("file_size.html.j2")
+_MEMORY_TEMPLATE = _TEMPLATE_ENV.get_template("memory.html.j2")
+_ALL_RESULTS_TEMPLATE = _TEMPLATE_ENV.get_template("all_results.html.j2")
+
+
+# Rendered test tabs are cached here, keyed by a hash of their inputs
+TAB_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    / "usd-parquet-report"
+)
+
+# Changes to this module or the tab template must invalidate cached tabs
+_TAB_CACHE_SALT = hashlib.blake2b(
+    Path(__file__).read_bytes()
+    + (Path(__file__).parent / "report_templates" / "tab.html.j2").read_bytes(),
+    digest_size=16,
+).digest()
+
+
+def _tab_cache_path(test_name: str, test_results) -> Path:
+    """Cache file for a tab rendered from exactly these results."""
+    key = hashlib.blake2b(_TAB_CACHE_SALT, digest_size=16)
+    key.update(json.dumps([test_name, test_results], sort_keys=True).encode())
+    return TAB_CACHE_DIR / f"{key.hexdigest()}-{test_name}.html"
+
+
+def _store_cached_tab(path: Path, content: str) -> None:
+    """Write a rendered tab to the cache atomically; caching is best-effort."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(content.encode("utf-8"))
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+class ProbeAgg(NamedTuple):
+    """Per-probe averages across the runs of one result (memory in MB)."""
+
+    labels: list[str]
+    elapsed_since_start: list[float]
+    elapsed_since_last: list[float]
+    mem_since_start: list[float]
+    mem_since_last: list[float]
+
+
+# Probe fields averaged per probe point, in ProbeAgg order
+_PROBE_FIELDS = (
+    "elapsed_since_start",
+    "elapsed_since_last",
+    "delta_since_start",
+    "delta_since_last",
+)
+
+# Probe table cell: cumulative time and memory delta at one probe
+_PROBE_CELL_FMT = "<td>%.4fs<br><small>%+.2f MB</small></td>"
+
+# Aggregated probes per (test, format), shared by the tab tables and charts
+_probe_cache: dict[tuple[str, str], ProbeAgg | None] = {}
+
+
+def _probes_to_array(probes_runs: list, num_probes: int) -> np.ndarray:
+    """Pack probe runs into a (runs, probes, fields) array; missing probes are 0."""
+    if all(len(run) == num_probes for run in probes_runs):
+        # Common case: every run hit the same probes, so build it in one go
+        return np.array(
+            [
+                [[p.get(f, 0) for f in _PROBE_FIELDS] for p in run]
+                for run in probes_runs
+            ],
+            dtype=np.float64,
         )
 
-        extra_info = []
-        if r.get("prim_count"):
-            extra_info.append(f"{r['prim_count']:,} prims")
-        if r.get("time_per_prim_us"):
-            extra_info.append(f"{r['time_per_prim_us']:.2f} µs/prim")
-        if r.get("property_count"):
-            extra_info.append(f"{r['property_count']} props")
-
-        table_rows.append(f"""
-            <tr>
-                <td><span class="badge {format_class}">{r["format"]}</span></td>
-                <td>{mean}</td>
-                <td>{std}</td>
-                <td>{memory}</td>
-                <td>{", ".join(extra_info) if extra_info else "-"}</td>
-            </tr>
-        """)
-
-    # Find winner
-    valid_results = [r for r in test_results if r.get("mean_seconds")]
-    if valid_results:
-        fastest = min(valid_results, key=lambda x: x["mean_seconds"])
-        winner_text = f'<div class="winner">{fastest["format"]} - {fastest["mean_seconds"] * 1000:.2f} ms</div>'
-    else:
-        winner_text = ""
-
-    canvas_id = test_name.replace("_", "-")
-
-    # Check for detailed probe data
-    has_probes = any("detailed_probes" in r for r in test_results)
-
-    probe_charts = ""
-    probe_table = ""
-    if has_probes:
-        # Get labels and values for a summary table
-        probe_rows = []
-        labels = []
-        for r in test_results:
-            probes_runs = r.get("detailed_probes")
-            if probes_runs and len(probes_runs) > 0:
-                labels = [p["label"] for p in probes_runs[0]]
-
-                # Average values across runs
-                num_runs = len(probes_runs)
-                num_probes = len(labels)
-                avg_times = [0.0] * num_probes
-                avg_mems = [0.0] * num_probes
-
-                for run in probes_runs:
-                    for i, p in enumerate(run):
-                        if i < num_probes:
-                            avg_times[i] += p.get("elapsed_since_start", 0)
-                            avg_mems[i] += p.get("delta_since_start", 0)
-
-                avg_times = [t / num_runs for t in avg_times]
-                avg_mems = [m / num_runs / (1024 * 1024) for m in avg_mems]
-
-                format_name = r["format"]
-                format_class = (
-                    "badge-usdc" if format_name == "usdc" else "badge-parquet"
-                )
-
-                row_cells = [
-                    f'<td><span class="badge {format_class}">{format_name}</span></td>'
-                ]
-                for i in range(num_probes):
-                    row_cells.append(
-                        f"<td>{avg_times[i]:.4f}s<br><small>{avg_mems[i]:+.2f} MB</small></td>"
-                    )
-
-                probe_rows.append(f"<tr>{''.join(row_cells)}</tr>")
-
-        if labels:
-            header_cells = ["<th>Format</th>"] + [f"<th>{l}</th>" for l in labels]
-            probe_table = f"""
-            <div class="card" style="margin-top: 1.5rem; overflow-x: auto;">
-                <h3>Probe Points Detail (Averages)</h3>
-                <p class="subtitle">Timing (s) and Cumulative Memory Delta (MB) at each probe</p>
-                <table class="probe-table">
-                    <thead>
-                        <tr>{"".join(header_cells)}</tr>
-                    </thead>
-                    <tbody>
-                        {"".join(probe_rows)}
-                    </tbody>
-                </table>
-            </div>
-            """
-
-        probe_charts = f"""
-        <div class="card">
-            <h3>Detailed Timing Analysis</h3>
-            <p class="subtitle">Line: Cumulative time • Bars: Time per step</p>
-            <div class="chart-container">
-                <canvas id="chart-{canvas_id}-timing"></canvas>
-            </div>
-        </div>
-        <div class="card">
-            <h3>Detailed Memory Analysis</h3>
-            <p class="subtitle">Line: Cumulative memory • Bars: Memory per step</p>
-            <div class="chart-container">
-                <canvas id="chart-{canvas_id}-memory"></canvas>
-            </div>
-        </div>
-        """
+    arr = np.zeros((len(probes_runs), num_probes, len(_PROBE_FIELDS)))
+    for run_index, run in enumerate(probes_runs):
+        for i, p in enumerate(run[:num_probes]):
+            arr[run_index, i] = [p.get(field, 0) for field in _PROBE_FIELDS]
+    return arr
+
+
+def aggregate_probes(row: "Row") -> ProbeAgg | None:
+    """Average a result's detailed probes across runs in a single pass."""
+    key = (row.test, row.fmt)
+    if key in _probe_cache:
+        return _probe_cache[key]
+
+    agg = None
+    probes_runs = row.probes
+    if probes_runs:
+        labels = [p["label"] for p in probes_runs[0]]
+        avg = _probes_to_array(probes_runs, len(labels)).mean(axis=0)
+        avg[:, 2:] *= INV_MB
+        agg = ProbeAgg(labels, *avg.T.tolist())
+
+    _probe_cache[key] = agg
+    return agg
+
+
+class Row(NamedTuple):
+    """The fields of one result the report reads, extracted once per result."""
+
+    fmt: str
+    badge: str
+    test: str
+    mean: float | None
+    std: float | None
+    min_s: float | None
+    max_s: float | None
+    peak_mb: float | None
+    current_mb: float
+    details: str
+    extras: str
+    probes: list | None
+    result: dict
+
+
+def to_row(r: dict) -> Row:
+    """Pull the fields every section needs out of a raw result dict."""
+    get = r.get
+    fmt = r["format"]
+    peak = get("peak_memory_bytes")
+    return Row(
+        fmt,
+        BADGE_CLASS.get(fmt, DEFAULT_BADGE),
+        r["test"],
+        get("mean_seconds"),
+        get("std_seconds"),
+        get("min_seconds"),
+        get("max_seconds"),
+        None if peak is None else peak * INV_MB,
+        _to_mb(get("current_memory_bytes")),
+        format_details(r, TAB_DETAILS),
+        format_details(r, RESULT_EXTRAS),
+        get("detailed_probes"),
+        r,
+    )
 
-    return f"""
-    <h2>{test_name.replace("_", " ").title()}</h2>
-    
-    <div class="grid">
-        <div class="card">
-            <h3>Performance Comparison</h3>
-            <div class="chart-container">
-                <canvas id="chart-{canvas_id}"></canvas>
-            </div>
-            {winner_text}
-        </div>
-        
-        <div class="card">
-            <h3>Detailed Results</h3>
-            <table>
-                <thead>
-                    <tr>
-                        <th>Format</th>
-                        <th>Mean Time</th>
-                        <th>Std Dev</th>
-                        <th>Memory</th>
-                        <th>Details</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    {"".join(table_rows)}
-                </tbody>
-            </table>
-        </div>
-    </div>
-    
-    <div class="grid">
-        {probe_charts}
-    </div>
-    
-    {probe_table}
+
+@dataclass(slots=True)
+class TestStats:
+    """Summary of one test's results, accumulated while bucketing them."""
+
+    fastest: Row | None = None
+    usdc: Row | None = None
+    parquet_seconds: float = 0.0
+    parquet_count: int = 0
+
+
+def group_results(
+    results: list[dict],
+) -> tuple[list[Row], dict[str, list[Row]], dict[str, TestStats]]:
+    """Convert results to rows, bucket them by test and summarise each bucket.
+
+    Everything happens in one pass over the raw dicts; the sections only ever
+    see the rows.
     """
+    rows = []
+    rows_by_test = {}
+    stats = {}
+    for r in results:
+        row = to_row(r)
+        rows.append(row)
+        test = row.test
+        bucket = rows_by_test.get(test)
+        if bucket is None:
+            bucket = rows_by_test[test] = []
+            stats[test] = TestStats()
+        bucket.append(row)
+
+        test_stats = stats[test]
+        mean = row.mean
+        if mean and (test_stats.fastest is None or mean < test_stats.fastest.mean):
+            test_stats.fastest = row
+        format_name = row.fmt
+        if format_name == "usdc":
+            if test_stats.usdc is None:
+                test_stats.usdc = row
+        elif "parquet" in format_name and mean is not None:
+            test_stats.parquet_seconds += mean
+            test_stats.parquet_count += 1
+    return rows, rows_by_test, stats
+
+
+def generate_tab_content(write, test_name, results_by_test, stats):
+    """Write the content for a specific test tab, reusing a cached render."""
+    test_results = results_by_test.get(test_name, ())
+
+    cache_path = _tab_cache_path(test_name, [row.result for row in test_results])
+    try:
+        write(cache_path.read_bytes().decode("utf-8"))
+        return
+    except OSError:
+        pass
 
+    # Probe summary rows as (badge, format, cells); the header uses the labels of
+    # the last result with probes
+    probe_rows = []
+    probe_labels = []
+    for r in test_results:
+        agg = aggregate_probes(r)
+        if agg is not None:
+            cells = "".join(
+                [
+                    _PROBE_CELL_FMT % pair
+                    for pair in zip(agg.elapsed_since_start, agg.mem_since_start)
+                ]
+            )
+            probe_rows.append((r.badge, r.fmt, cells))
+            probe_labels = agg.labels
+
+    content = _TAB_TEMPLATE.render(
+        test_name=test_name,
+        canvas_id=test_name.replace("_", "-"),
+        results=test_results,
+        fastest=stats[test_name].fastest if test_results else None,
+        has_probes=any(r.probes is not None for r in test_results),
+        probe_rows=probe_rows,
+        probe_labels=probe_labels,
+    )
+    _store_cached_tab(cache_path, content)
+    write(content)
 
-def generate_overview_content(data):
-    """Generate overview tab content."""
-    file_sizes = data.get("file_sizes", {})
-    results = data.get("results", [])
 
-    # Calculate key metrics
-    initial_load = [
-        r for r in results if r["test"] in ["initial_load", "initial_load_cold"]
-    ]
-    traversal = [
-        r
-        for r in results
-        if r["test"] in ["single_property_traversal", "multi_property_traversal"]
-    ]
-
-    usdc_load = next((r for r in initial_load if r["format"] == "usdc"), None)
-    parquet_loads = [r for r in initial_load if "parquet" in r["format"]]
-
-    speedup = ""
-    if usdc_load and parquet_loads:
-        avg_parquet = sum(r["mean_seconds"] for r in parquet_loads) / len(parquet_loads)
-        speedup_factor = usdc_load["mean_seconds"] / avg_parquet
-        speedup = f"""
-        <div class="metric">
-            <div class="metric-label">Parquet Load Speed Advantage</div>
-            <div class="metric-value">{speedup_factor:.1f}x faster</div>
-        </div>
-        """
+def generate_overview_content(write, stats, file_sizes, result_count):
+    """Write the overview tab content."""
+
+    # Calculate key metrics from the initial load tests
+    initial_load = [s for test, s in stats.items() if test in _INITIAL_LOAD_TESTS]
+    usdc_load = next((s.usdc for s in initial_load if s.usdc), None)
+    parquet_count = sum(s.parquet_count for s in initial_load)
 
-    file_size_comparison = ""
+    speedup_factor = None
+    if usdc_load and parquet_count:
+        avg_parquet = sum(s.parquet_seconds for s in initial_load) / parquet_count
+        speedup_factor = usdc_load.mean / avg_parquet
+
+    size_savings = None
     if "usdc" in file_sizes and any("parquet" in k for k in file_sizes):
         usdc_size = file_sizes["usdc"]
         parquet_sizes = {k: v for k, v in file_sizes.items() if "parquet" in k}
         best_parquet = min(parquet_sizes.values())
-        compression = (1 - best_parquet / usdc_size) * 100
-        file_size_comparison = f"""
-        <div class="metric">
-            <div class="metric-label">Best File Size Savings</div>
-            <div class="metric-value">{compression:.0f}% smaller</div>
-        </div>
-        """
+        size_savings = (1 - best_parquet / usdc_size) * 100
 
-    return f"""
-    <h2>Performance Summary</h2>
-    
-    <div class="grid">
-        <div class="card">
-            <h3>Key Metrics</h3>
-            {speedup}
-            {file_size_comparison}
-            <div class="metric">
-                <div class="metric-label">Total Tests Run</div>
-                <div class="metric-value">{len(results)}</div>
-            </div>
-        </div>
-        
-        <div class="card">
-            <h3>File Sizes</h3>
-            <div class="chart-container">
-                <canvas id="overview-file-size"></canvas>
-            </div>
-        </div>
-    </div>
-    
-    <div class="comparison">
-        <h3>Quick Comparison</h3>
-        <p><strong>Parquet excels at:</strong> Initial load speed, file size, lazy loading</p>
-        <p><strong>USDC excels at:</strong> Bulk traversals, multi-property reads, consistent performance</p>
-    </div>
-    """
+    write(
+        _OVERVIEW_TEMPLATE.render(
+            speedup_factor=speedup_factor,
+            size_savings=size_savings,
+            result_count=result_count,
+        )
+    )
 
 
-def generate_file_size_content(data):
-    """Generate file size tab content."""
-    file_sizes = data.get("file_sizes", {})
+def generate_file_size_content(write, sorted_file_sizes):
+    """Write the file size tab content from (format, bytes) pairs in order."""
+    write(_FILE_SIZE_TEMPLATE.render(file_sizes=sorted_file_sizes))
 
-    table_rows = []
-    for format_name, size_bytes in sorted(file_sizes.items()):
-        size_mb = size_bytes / (1024 * 1024)
-        format_class = "badge-usdc" if format_name == "usdc" else "badge-parquet"
-        table_rows.append(f"""
-            <tr>
-                <td><span class="badge {format_class}">{format_name}</span></td>
-                <td>{size_mb:.2f} MB</td>
-                <td>{size_bytes:,} bytes</td>
-            </tr>
-        """)
-
-    return f"""
-    <h2>File Size Comparison</h2>
-    
-    <div class="grid">
-        <div class="card">
-            <h3>File Sizes by Format</h3>
-            <div class="chart-container">
-                <canvas id="file-size-chart"></canvas>
-            </div>
-        </div>
-        
-        <div class="card">
-            <h3>Size Details</h3>
-            <table>
-                <thead>
-                    <tr>
-                        <th>Format</th>
-                        <th>Size (MB)</th>
-                        <th>Size (Bytes)</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    {"".join(table_rows)}
-                </tbody>
-            </table>
-        </div>
-    </div>
-    """
 
+def generate_memory_content(write, results_by_test, sorted_tests):
+    """Write the memory analysis tab content."""
+    # Results with memory data, grouped by test in name order
+    memory_groups = []
+    for test in sorted_tests:
+        measured = [r for r in results_by_test[test] if r.peak_mb is not None]
+        if measured:
+            memory_groups.append((test, measured))
 
-def generate_memory_content(data):
-    """Generate memory analysis tab content."""
-    results = data.get("results", [])
+    write(
+        _MEMORY_TEMPLATE.render(
+            memory_groups=memory_groups,
+            total_measured=sum(len(v) for _, v in memory_groups),
+        )
+    )
 
-    # Group results by test type
-    memory_by_test = {}
-    for r in results:
-        if r.get("peak_memory_bytes") is not None:
-            test = r["test"]
-            if test not in memory_by_test:
-                memory_by_test[test] = []
-            memory_by_test[test].append(r)
-
-    if not memory_by_test:
-        return """
-        <h2>Memory Analysis</h2>
-        <div class="card">
-            <p>No memory measurements available in this test run.</p>
-            <p>Memory tracking measures the RSS (Resident Set Size) delta during operations.</p>
-        </div>
-        """
-
-    # Create summary
-    total_measured = sum(len(v) for v in memory_by_test.values())
-    tests_with_data = len(memory_by_test)
-
-    # Create table for all memory measurements
-    table_rows = []
-    for test_name in sorted(memory_by_test.keys()):
-        for r in memory_by_test[test_name]:
-            format_class = "badge-usdc" if r["format"] == "usdc" else "badge-parquet"
-            peak_mb = r.get("peak_memory_bytes", 0) / (1024 * 1024)
-            current_mb = r.get("current_memory_bytes", 0) / (1024 * 1024)
-            mean_time = (
-                f"{r.get('mean_seconds', 0) * 1000:.2f} ms"
-                if r.get("mean_seconds")
-                else "-"
-            )
 
-            # Determine if significant memory was used
-            significance = (
-                "Minimal"
-                if peak_mb < 0.1
-                else (
-                    "Low" if peak_mb < 10 else ("Medium" if peak_mb < 100 else "High")
-                )
-            )
+def generate_all_results_table(write, rows):
+    """Write the complete results table."""
+    write(_ALL_RESULTS_TEMPLATE.render(results=rows))
 
-            table_rows.append(f"""
-                <tr>
-                    <td>{test_name}</td>
-                    <td><span class="badge {format_class}">{r["format"]}</span></td>
-                    <td>{peak_mb:.2f} MB</td>
-                    <td>{current_mb:.2f} MB</td>
-                    <td>{mean_time}</td>
-                    <td>{significance}</td>
-                </tr>
-            """)
-
-    # Create chart data
-    chart_section = ""
-    if memory_by_test:
-        chart_section = f"""
-        <div class="card">
-            <h3>Memory Usage by Test</h3>
-            <div class="chart-container">
-                <canvas id="memory-overview-chart"></canvas>
-            </div>
-        </div>
-        """
 
-    return f"""
-    <h2>Memory Analysis</h2>
-    
-    <div class="summary-grid">
-        <div class="summary-card">
-            <div class="summary-value">{tests_with_data}</div>
-            <div class="summary-label">Tests with Memory Data</div>
-        </div>
-        <div class="summary-card">
-            <div class="summary-value">{total_measured}</div>
-            <div class="summary-label">Measurements</div>
-        </div>
-    </div>
-    
-    <div class="comparison">
-        <h3>About Memory Measurements</h3>
-        <p><strong>What we measure:</strong> Process RSS (Resident Set Size) delta during operations</p>
-        <p><strong>Why values might be 0 MB:</strong></p>
-        <ul style="margin-left: 1.5rem; margin-top: 0.5rem; color: var(--text-secondary);">
-            <li>Operations complete quickly and memory is freed immediately</li>
-            <li>Lazy loading doesn't allocate significant memory upfront</li>
-            <li>Memory might be allocated and freed within the measurement window</li>
-            <li>USD's internal caching may reuse existing allocations</li>
-        </ul>
-        <p style="margin-top: 1rem;"><strong>Interpretation:</strong> 0 MB delta indicates efficient memory usage and true lazy loading behavior</p>
-    </div>
-    
-    <div class="grid">
-        {chart_section}
-        
-        <div class="card">
-            <h3>Memory Measurements</h3>
-            <div style="max-height: 500px; overflow-y: auto;">
-                <table>
-                    <thead>
-                        <tr>
-                            <th>Test</th>
-                            <th>Format</th>
-                            <th>Peak Memory</th>
-                            <th>Final Memory</th>
-                            <th>Duration</th>
-                            <th>Significance</th>
-                        </tr>
-                    </thead>
-                    <tbody>
-                        {"".join(table_rows)}
-                    </tbody>
-                </table>
-            </div>
-        </div>
-    </div>
-    
-    <div class="comparison" style="margin-top: 2rem;">
-        <h3>Memory Efficiency Insights</h3>
-        <p><strong>Parquet:</strong> Shows 0 MB delta during initial load, confirming true lazy loading - no property data loaded into memory</p>
-        <p><strong>USDC:</strong> Also shows minimal memory delta, as USD efficiently manages composition metadata</p>
-        <p><strong>Key Takeaway:</strong> Both formats demonstrate excellent memory efficiency for the tested operations. Memory differences would be more apparent in tests that traverse and cache large amounts of property data.</p>
-    </div>
-    """
+def _round_values(values: list[float]) -> list[float]:
+    """Round chart values to 6 digits, well below what the charts can show."""
+    return [round(x, 6) for x in values]
 
 
-def generate_all_results_table(results):
-    """Generate the complete results table."""
-    rows = []
-    for r in results:
-        format_class = "badge-usdc" if r["format"] == "usdc" else "badge-parquet"
-        mean = f"{r['mean_seconds']:.6f}s" if r.get("mean_seconds") else "-"
-        std = f"±{r['std_seconds']:.6f}s" if r.get("std_seconds") else "-"
-        min_time = f"{r['min_seconds']:.6f}s" if r.get("min_seconds") else "-"
-        max_time = f"{r['max_seconds']:.6f}s" if r.get("max_seconds") else "-"
-        memory = (
-            f"{r.get('peak_memory_bytes', 0) / (1024 * 1024):.2f} MB"
-            if r.get("peak_memory_bytes")
-            else "-"
+def _collect_probe_data(rows):
+    """Averaged probe datasets per test, for the detailed probe charts."""
+    probe_data = {}
+    for r in rows:
+        agg = aggregate_probes(r)
+        if agg is None:
+            continue
+        entry = probe_data.setdefault(r.test, {"labels": agg.labels, "datasets": []})
+        entry["datasets"].append(
+            {
+                "format": r.fmt,
+                "elapsed_since_start": _round_values(agg.elapsed_since_start),
+                "elapsed_since_last": _round_values(agg.elapsed_since_last),
+                "mem_since_start": _round_values(agg.mem_since_start),
+                "mem_since_last": _round_values(agg.mem_since_last),
+            }
         )
+    return probe_data
 
-        extra = []
-        if r.get("prim_count"):
-            extra.append(f"{r['prim_count']:,} prims")
-        if r.get("time_per_prim_us"):
-            extra.append(f"{r['time_per_prim_us']:.2f} µs/prim")
-        if r.get("size_mb"):
-            extra.append(f"{r['size_mb']:.2f} MB")
-
-        rows.append(f"""
-            <tr>
-                <td>{r["test"]}</td>
-                <td><span class="badge {format_class}">{r["format"]}</span></td>
-                <td>{mean}</td>
-                <td>{std}</td>
-                <td>{min_time}</td>
-                <td>{max_time}</td>
-                <td>{memory}</td>
-                <td>{", ".join(extra) if extra else "-"}</td>
-            </tr>
-        """)
-
-    return f"""
-    <h2>All Test Results</h2>
-    <div class="card">
-        <div style="max-height: 600px; overflow-y: auto;">
-            <table>
-                <thead>
-                    <tr>
-                        <th>Test</th>
-                        <th>Format</th>
-                        <th>Mean</th>
-                        <th>Std Dev</th>
-                        <th>Min</th>
-                        <th>Max</th>
-                        <th>Memory</th>
-                        <th>Extra</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    {"".join(rows)}
-                </tbody>
-            </table>
-        </div>
-    </div>
-    """
 
+def embedded_data(data: dict, results: list[dict]) -> dict:
+    """The results document as embedded in the page, without raw probe runs.
 
-def generate_chart_init(results):
-    """Generate JavaScript to initialize all charts."""
-    unique_tests = list(set(r["test"] for r in results))
-
-    chart_calls = []
-
-    # Overview file size chart
-    chart_calls.append("""
-        const fileSizes = data.file_sizes;
-        const fileSizeLabels = Object.keys(fileSizes);
-        const fileSizeValues = Object.values(fileSizes).map(v => v / (1024 * 1024));
-        createChart('overview-file-size', fileSizeLabels.map((label, idx) => ({
-            format: label,
-            mean_seconds: fileSizeValues[idx] / 1000  // Dummy value for chart
-        })), 'MB', fileSizeValues);
-    """)
-
-    # File size chart
-    chart_calls.append("""
-        createChart('file-size-chart', fileSizeLabels.map((label, idx) => ({
-            format: label,
-            mean_seconds: fileSizeValues[idx] / 1000
-        })), 'MB', fileSizeValues);
-    """)
-
-    # Test-specific charts
-    for test in unique_tests:
-        canvas_id = f"chart-{test.replace('_', '-')}"
-        chart_calls.append(f"""
-            createChart('{canvas_id}', data.results.filter(r => r.test === '{test}'), 'seconds');
-        """)
-
-        # Detailed probe charts
-        test_results = [r for r in results if r["test"] == test]
-        has_probes = any(r.get("detailed_probes") for r in test_results)
-
-        if has_probes:
-            # Get labels from first result with probes
-            labels = []
-            for r in test_results:
-                probes = r.get("detailed_probes")
-                if probes and len(probes) > 0:
-                    labels = [p["label"] for p in probes[0]]
-                    break
-
-            if labels:
-                timing_datasets = []
-                memory_datasets = []
-
-                for r in test_results:
-                    probes_runs = r.get("detailed_probes")
-                    if not probes_runs:
-                        continue
-
-                    format_name = r["format"]
-
-                    # Calculate averages
-                    num_runs = len(probes_runs)
-                    num_probes = len(labels)
-
-                    acc_elapsed_start = [0.0] * num_probes
-                    acc_elapsed_last = [0.0] * num_probes
-                    acc_mem_start = [0.0] * num_probes
-                    acc_mem_last = [0.0] * num_probes
-
-                    for run in probes_runs:
-                        for i, probe in enumerate(run):
-                            if i < num_probes:
-                                acc_elapsed_start[i] += probe.get(
-                                    "elapsed_since_start", 0
-                                )
-                                acc_elapsed_last[i] += probe.get(
-                                    "elapsed_since_last", 0
-                                )
-                                acc_mem_start[i] += probe.get("delta_since_start", 0)
-                                acc_mem_last[i] += probe.get("delta_since_last", 0)
-
-                    avg_elapsed_start = [x / num_runs for x in acc_elapsed_start]
-                    avg_elapsed_last = [x / num_runs for x in acc_elapsed_last]
-                    avg_mem_start = [
-                        x / num_runs / (1024 * 1024) for x in acc_mem_start
-                    ]
-                    avg_mem_last = [x / num_runs / (1024 * 1024) for x in acc_mem_last]
-
-                    # Add datasets
-                    timing_datasets.append(f"""{{
-                        type: 'line',
-                        label: '{format_name} (Cumulative)',
-                        data: {avg_elapsed_start},
-                        borderColor: getColor('{format_name}'),
-                        backgroundColor: getColor('{format_name}'),
-                        tension: 0.1,
-                        order: 0
-                    }}""")
-                    timing_datasets.append(f"""{{
-                        type: 'bar',
-                        label: '{format_name} (Step)',
-                        data: {avg_elapsed_last},
-                        backgroundColor: getColor('{format_name}').replace('0.9', '0.3'),
-                        borderColor: getColor('{format_name}'),
-                        borderWidth: 1,
-                        order: 1
-                    }}""")
-
-                    memory_datasets.append(f"""{{
-                        type: 'line',
-                        label: '{format_name} (Cumulative)',
-                        data: {avg_mem_start},
-                        borderColor: getColor('{format_name}'),
-                        backgroundColor: getColor('{format_name}'),
-                        tension: 0.1,
-                        order: 0
-                    }}""")
-                    memory_datasets.append(f"""{{
-                        type: 'bar',
-                        label: '{format_name} (Step)',
-                        data: {avg_mem_last},
-                        backgroundColor: getColor('{format_name}').replace('0.9', '0.3'),
-                        borderColor: getColor('{format_name}'),
-                        borderWidth: 1,
-                        order: 1
-                    }}""")
-
-                chart_calls.append(f"""
-                    createProbeChart('{canvas_id}-timing', [{",".join(timing_datasets)}], {json.dumps(labels)}, 'seconds');
-                    createProbeChart('{canvas_id}-memory', [{",".join(memory_datasets)}], {json.dumps(labels)}, 'MB');
-                """)
-
-    # Memory overview chart
-    chart_calls.append("""
-        const memoryResults = data.results.filter(r => r.peak_memory_bytes != null);
-        if (memoryResults.length > 0) {
-            // Group by test and format
-            const memoryByTest = {};
-            memoryResults.forEach(r => {
-                const key = r.test;
-                if (!memoryByTest[key]) memoryByTest[key] = [];
-                memoryByTest[key].push({
-                    format: r.format,
-                    memory: r.peak_memory_bytes / (1024 * 1024)
-                });
-            });
-            
-            // Create chart with all formats for each test
-            const allFormats = [...new Set(memoryResults.map(r => r.format))];
-            const testNames = Object.keys(memoryByTest);
-            
-            if (testNames.length > 0) {
-                const datasets = allFormats.map(format => ({
-                    label: format,
-                    data: testNames.map(test => {
-                        const item = memoryByTest[test].find(m => m.format === format);
-                        return item ? item.memory : 0;
-                    }),
-                    backgroundColor: getColor(format)
-                }));
-                
-                const canvas = document.getElementById('memory-overview-chart');
-                if (canvas) {
-                    new Chart(canvas, {
-                        type: 'bar',
-                        data: {
-                            labels: testNames.map(t => t.replace(/_/g, ' ')),
-                            datasets: datasets
-                        },
-                        options: {
-                            responsive: true,
-                            maintainAspectRatio: false,
-                            plugins: { 
-                                legend: { display: true, labels: { color: '#e6edf3' } },
-                                title: { display: true, text: 'Peak Memory by Test', color: '#e6edf3' }
-                            },
-                            scales: {
-                                y: { 
-                                    beginAtZero: true, 
-                                    title: { display: true, text: 'MB', color: '#8b949e' }, 
-                                    ticks: { color: '#8b949e' }, 
-                                    grid: { color: '#30363d' } 
-                                },
-                                x: { 
-                                    ticks: { color: '#8b949e', maxRotation: 45 }, 
-                                    grid: { display: false } 
-                                }
-                            }
-                        }
-                    });
-                }
-            }
-        }
-    """)
-
-    return "\n".join(chart_calls)
+    The charts only read the per-run summary fields; averaged probes already
+    travel in the chart payload, so the raw runs would just bloat the page.
+    """
+    return {
+        **data,
+        "results": [
+            {k: v for k, v in r.items() if k != "detailed_probes"}
+            if "detailed_probes" in r
+            else r
+            for r in results
+        ],
+    }
+
+
+def generate_chart_init(rows, results_by_test):
+    """Generate the JavaScript call that initializes all charts.
+
+    The chart-building code lives in the template as initCharts(); this only
+    serializes the data it needs.
+    """
+    payload = {
+        "tests": list(results_by_test),
+        "probes": _collect_probe_data(rows),
+    }
+    return f"initCharts({_dumps(payload)});"
 
 
-# HTML template with tabs
-HTML_TEMPLATE = (
-    open(Path(__file__).parent / "report_template.html").read()
-    if (Path(__file__).parent / "report_template.html").exists()
-    else """<!DOCTYPE html>
+# HTML template with tabs (report_template.html next to this file overrides it)
+HTML_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Benchmark Report: Parquet vs USDC</title>
     <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
-    <style>
-        :root {
-            --bg-primary: #0d1117;
-            --bg-secondary: #161b22;
-            --bg-tertiary: #21262d;
-            --text-primary: #e6edf3;
-            --text-secondary: #8b949e;
-            --accent-blue: #58a6ff;
-            --accent-green: #3fb950;
-            --accent-purple: #a371f7;
-            --border-color: #30363d;
-            --tab-active: #1f6feb;
-        }
-        
-        * { box-sizing: border-box; margin: 0; padding: 0; }
-        
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: var(--bg-primary);
-            color: var(--text-primary);
-            line-height: 1.6;
-            padding: 2rem;
-        }
-        
-        .container { max-width: 1600px; margin: 0 auto; }
-        
-        h1 {
-            font-size: 2.5rem;
-            margin-bottom: 0.5rem;
-            background: linear-gradient(135deg, var(--accent-blue), var(--accent-purple));
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-        }
-        
-        h2 {
-            font-size: 1.5rem;
-            margin: 2rem 0 1rem 0;
-            color: var(--accent-blue);
-        }
-        
-        h3 {
-            font-size: 1.1rem;
-            margin-bottom: 1rem;
-            color: var(--text-primary);
-        }
-        
-        .subtitle {
-            color: var(--text-secondary);
-            margin-bottom: 2rem;
-        }
-        
-        /* Tabs */
-        .tab-nav {
-            display: flex;
-            gap: 0.5rem;
-            margin: 2rem 0;
-            border-bottom: 2px solid var(--border-color);
-            overflow-x: auto;
-            flex-wrap: wrap;
-        }
-        
-        .tab-button {
-            padding: 0.75rem 1.5rem;
-            background: transparent;
-            border: none;
-            border-bottom: 3px solid transparent;
-            color: var(--text-secondary);
-            cursor: pointer;
-            font-size: 0.95rem;
-            font-weight: 500;
-            white-space: nowrap;
-            transition: all 0.2s;
-        }
-        
-        .tab-button:hover {
-            color: var(--text-primary);
-            background: var(--bg-tertiary);
-        }
-        
-        .tab-button.active {
-            color: var(--accent-blue);
-            border-bottom-color: var(--tab-active);
-        }
-        
-        .tab-content {
-            display: none;
-            animation: fadeIn 0.3s;
-        }
-        
-        .tab-content.active { display: block; }
-        
-        @keyframes fadeIn {
-            from { opacity: 0; transform: translateY(10px); }
-            to { opacity: 1; transform: translateY(0); }
-        }
-        
-        .grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(500px, 1fr));
-            gap: 1.5rem;
-            margin-bottom: 2rem;
-        }
-        
-        .card {
-            background: var(--bg-secondary);
-            border: 1px solid var(--border-color);
-            border-radius: 12px;
-            padding: 1.5rem;
-        }
-        
-        .chart-container {
-            position: relative;
-            height: 350px;
-        }
-        
-        table {
-            width: 100%;
-            border-collapse: collapse;
-            font-size: 0.85rem;
-        }
-        
-        th, td {
-            padding: 0.75rem;
-            text-align: left;
-            border-bottom: 1px solid var(--border-color);
-        }
-        
-        th {
-            background: var(--bg-tertiary);
-            color: var(--text-secondary);
-            font-weight: 600;
-            text-transform: uppercase;
-            font-size: 0.7rem;
-        }
-        
-        tr:hover { background: var(--bg-tertiary); }
-        
-        .badge {
-            display: inline-block;
-            padding: 0.2rem 0.5rem;
-            border-radius: 4px;
-            font-size: 0.75rem;
-            font-weight: 600;
-        }
-        
-        .badge-parquet {
-            background: rgba(163, 113, 247, 0.2);
-            color: var(--accent-purple);
-        }
-        
-        .badge-usdc {
-            background: rgba(63, 185, 80, 0.2);
-            color: var(--accent-green);
-        }
-        
-        .summary-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(180px, 1fr));
-            gap: 1rem;
-            margin-bottom: 2rem;
-        }
-        
-        .summary-card {
-            background: var(--bg-secondary);
-            border: 1px solid var(--border-color);
-            border-radius: 8px;
-            padding: 1.25rem;
-            text-align: center;
-        }
-        
-        .summary-value {
-            font-size: 2rem;
-            font-weight: bold;
-            color: var(--accent-blue);
-            margin-bottom: 0.25rem;
-        }
-        
-        .summary-label {
-            color: var(--text-secondary);
-            font-size: 0.85rem;
-        }
-        
-        .metric {
-            margin: 1rem 0;
-            padding: 1rem;
-            background: var(--bg-tertiary);
-            border-radius: 8px;
-            border-left: 3px solid var(--accent-blue);
-        }
-        
-        .metric-label {
-            color: var(--text-secondary);
-            font-size: 0.85rem;
-            margin-bottom: 0.25rem;
-        }
-        
-        .metric-value {
-            font-size: 1.5rem;
-            font-weight: 600;
-            color: var(--text-primary);
-        }
-        
-        .comparison {
-            margin-top: 2rem;
-            padding: 1.5rem;
-            background: var(--bg-secondary);
-            border-radius: 12px;
-            border: 1px solid var(--border-color);
-        }
-        
-        .winner {
-            display: inline-flex;
-            align-items: center;
-            gap: 0.5rem;
-            padding: 0.5rem 1rem;
-            background: rgba(63, 185, 80, 0.1);
-            border: 1px solid rgba(63, 185, 80, 0.3);
-            border-radius: 6px;
-            color: var(--accent-green);
-            font-weight: 600;
-            margin: 0.5rem 0;
-        }
-        
-        .winner::before {
-            content: "✓";
-            font-size: 1.2rem;
-        }
-
-        .probe-table th {
-            white-space: nowrap;
-            font-size: 0.65rem;
-        }
-
-        .probe-table td {
-            white-space: nowrap;
-        }
-
-        .probe-table small {
-            color: var(--text-secondary);
-        }
-    </style>
+    <style>{{style}}</style>
 </head>
 <body>
     <div class="container">
@@ -1075,6 +583,122 @@ HTML_TEMPLATE = (
             });
         }
         
+        function probeDatasets(format, cumulative, step) {
+            return [{
+                type: 'line',
+                label: format + ' (Cumulative)',
+                data: cumulative,
+                borderColor: getColor(format),
+                backgroundColor: getColor(format),
+                tension: 0.1,
+                order: 0
+            }, {
+                type: 'bar',
+                label: format + ' (Step)',
+                data: step,
+                backgroundColor: getColor(format).replace('0.9', '0.3'),
+                borderColor: getColor(format),
+                borderWidth: 1,
+                order: 1
+            }];
+        }
+
+        function initCharts(report) {
+            // File size charts (overview and file size tabs)
+            const fileSizes = data.file_sizes;
+            const fileSizeLabels = Object.keys(fileSizes);
+            const fileSizeValues = Object.values(fileSizes).map(v => v / (1024 * 1024));
+            const fileSizeResults = fileSizeLabels.map((label, idx) => ({
+                format: label,
+                mean_seconds: fileSizeValues[idx] / 1000  // Dummy value for chart
+            }));
+            createChart('overview-file-size', fileSizeResults, 'MB', fileSizeValues);
+            createChart('file-size-chart', fileSizeResults, 'MB', fileSizeValues);
+
+            // Test-specific charts, from results bucketed by test in one pass
+            const resultsByTest = {};
+            data.results.forEach(r => {
+                (resultsByTest[r.test] ||= []).push(r);
+            });
+            report.tests.forEach(test => {
+                const canvasId = 'chart-' + test.replace(/_/g, '-');
+                createChart(canvasId, resultsByTest[test] || [], 'seconds');
+
+                // Detailed probe charts
+                const probes = report.probes[test];
+                if (!probes) return;
+                const timingDatasets = [];
+                const memoryDatasets = [];
+                probes.datasets.forEach(d => {
+                    timingDatasets.push(...probeDatasets(d.format, d.elapsed_since_start, d.elapsed_since_last));
+                    memoryDatasets.push(...probeDatasets(d.format, d.mem_since_start, d.mem_since_last));
+                });
+                createProbeChart(canvasId + '-timing', timingDatasets, probes.labels, 'seconds');
+                createProbeChart(canvasId + '-memory', memoryDatasets, probes.labels, 'MB');
+            });
+
+            // Memory overview chart
+            const memoryResults = data.results.filter(r => r.peak_memory_bytes != null);
+            if (memoryResults.length > 0) {
+                // Group by test and format
+                const memoryByTest = {};
+                memoryResults.forEach(r => {
+                    const key = r.test;
+                    if (!memoryByTest[key]) memoryByTest[key] = [];
+                    memoryByTest[key].push({
+                        format: r.format,
+                        memory: r.peak_memory_bytes / (1024 * 1024)
+                    });
+                });
+            
+                // Create chart with all formats for each test
+                const allFormats = [...new Set(memoryResults.map(r => r.format))];
+                const testNames = Object.keys(memoryByTest);
+            
+                if (testNames.length > 0) {
+                    const datasets = allFormats.map(format => ({
+                        label: format,
+                        data: testNames.map(test => {
+                            const item = memoryByTest[test].find(m => m.format === format);
+                            return item ? item.memory : 0;
+                        }),
+                        backgroundColor: getColor(format)
+                    }));
+                
+                    const canvas = document.getElementById('memory-overview-chart');
+                    if (canvas) {
+                        new Chart(canvas, {
+                            type: 'bar',
+                            data: {
+                                labels: testNames.map(t => t.replace(/_/g, ' ')),
+                                datasets: datasets
+                            },
+                            options: {
+                                responsive: true,
+                                maintainAspectRatio: false,
+                                plugins: { 
+                                    legend: { display: true, labels: { color: '#e6edf3' } },
+                                    title: { display: true, text: 'Peak Memory by Test', color: '#e6edf3' }
+                                },
+                                scales: {
+                                    y: { 
+                                        beginAtZero: true, 
+                                        title: { display: true, text: 'MB', color: '#8b949e' }, 
+                                        ticks: { color: '#8b949e' }, 
+                                        grid: { color: '#30363d' } 
+                                    },
+                                    x: { 
+                                        ticks: { color: '#8b949e', maxRotation: 45 }, 
+                                        grid: { display: false } 
+                                    }
+                                }
+                            }
+                        });
+                    }
+                }
+            }
+        }
+
         window.addEventListener('load', () => {
             {{chart_initialization}}
         });
@@ -1082,85 +706,138 @@ HTML_TEMPLATE = (
 </body>
 </html>
 """
-)
+
+
+def _package_files():
+    """Return the directory holding the report's packaged assets."""
+    return resources.files(__package__) if __package__ else Path(__file__).parent
+
+
+# {{name}} placeholders in the page template; the group keeps names in split()
+_PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
+
+
+@lru_cache(maxsize=1)
+def _html_template() -> tuple[str, ...]:
+    """Load and compile the page template once.
+
+    report_template.html next to this module overrides HTML_TEMPLATE. The
+    template is split on its placeholders up front: literal text sits at
+    even indices and placeholder names at odd ones, so rendering is just a
+    join.
+    """
+    try:
+        text = _package_files().joinpath("report_template.html").read_text()
+    except FileNotFoundError:
+        text = HTML_TEMPLATE
+    return tuple(_PLACEHOLDER_RE.split(text))
+
+
+def render_page(subs: dict[str, str]) -> str:
+    """Fill the compiled page template; unknown placeholders are kept as-is."""
+    parts = list(_html_template())
+    for i in range(1, len(parts), 2):
+        name = parts[i]
+        value = subs.get(name)
+        parts[i] = "{{%s}}" % name if value is None else value
+    return "".join(parts)
+
+
+@lru_cache(maxsize=1)
+def _report_css() -> str:
+    """Load the pre-minified report stylesheet once."""
+    return _package_files().joinpath("report_style.min.css").read_text().strip()
 
 
 def generate_html_report(data: dict, output_path: Path) -> None:
     """Generate tabbed HTML report."""
     results = data.get("results", [])
+    _probe_cache.clear()
 
-    # Get unique test names
-    test_names = list(set(r["test"] for r in results if r["test"] != "file_size"))
-    test_names.sort()
-
-    # Generate tab buttons
-    tab_buttons = [
-        '<button class="tab-button active" onclick="showTab(\'overview\')">Overview</button>'
-    ]
-    tab_buttons.append(
-        '<button class="tab-button" onclick="showTab(\'file-size\')">File Size</button>'
-    )
-
-    for test_name in test_names:
-        display_name = test_name.replace("_", " ").title()
-        tab_id = test_name.replace("_", "-")
-        tab_buttons.append(
-            f'<button class="tab-button" onclick="showTab(\'{tab_id}\')">{display_name}</button>'
-        )
+    # Extract and bucket result fields once; every section reads the rows
+    rows, results_by_test, stats = group_results(results)
 
-    # Add Memory tab
-    tab_buttons.append(
-        '<button class="tab-button" onclick="showTab(\'memory\')">Memory Analysis</button>'
-    )
-    tab_buttons.append(
-        '<button class="tab-button" onclick="showTab(\'all-results\')">All Results</button>'
-    )
+    # Sort test names and file sizes once for every section that lists them
+    sorted_tests = sorted(results_by_test)
+    test_names = [t for t in sorted_tests if t != "file_size"]
+    file_sizes = data.get("file_sizes", {})
+    sorted_file_sizes = sorted(file_sizes.items())
 
-    # Generate tab contents
-    tab_contents = []
+    # Generate each tab's button and content together, streaming both into
+    # their own buffers
+    tab_buttons = io.StringIO()
+    button = tab_buttons.write
+    tab_contents = io.StringIO()
+    write = tab_contents.write
 
     # Overview tab
-    tab_contents.append(
-        f'<div id="overview" class="tab-content active">{generate_overview_content(data)}</div>'
+    button(
+        '<button class="tab-button active" onclick="showTab(\'overview\')">Overview</button>\n'
     )
+    write('<div id="overview" class="tab-content active">')
+    generate_overview_content(write, stats, file_sizes, len(results))
+    write("</div>\n")
 
     # File size tab
-    tab_contents.append(
-        f'<div id="file-size" class="tab-content">{generate_file_size_content(data)}</div>'
+    button(
+        '<button class="tab-button" onclick="showTab(\'file-size\')">File Size</button>\n'
     )
+    write('<div id="file-size" class="tab-content">')
+    generate_file_size_content(write, sorted_file_sizes)
+    write("</div>\n")
 
     # Test tabs
     for test_name in test_names:
+        display_name = test_name.replace("_", " ").title()
         tab_id = test_name.replace("_", "-")
-        content = generate_tab_content(test_name, results, data)
-        tab_contents.append(f'<div id="{tab_id}" class="tab-content">{content}</div>')
+        button(
+            f'<button class="tab-button" onclick="showTab(\'{tab_id}\')">{display_name}</button>\n'
+        )
+        write(f'<div id="{tab_id}" class="tab-content">')
+        generate_tab_content(write, test_name, results_by_test, stats)
+        write("</div>\n")
 
     # Memory tab
-    tab_contents.append(
-        f'<div id="memory" class="tab-content">{generate_memory_content(data)}</div>'
+    button(
+        '<button class="tab-button" onclick="showTab(\'memory\')">Memory Analysis</button>\n'
     )
+    write('<div id="memory" class="tab-content">')
+    generate_memory_content(write, results_by_test, sorted_tests)
+    write("</div>\n")
 
     # All results tab
-    tab_contents.append(
-        f'<div id="all-results" class="tab-content">{generate_all_results_table(results)}</div>'
+    button(
+        '<button class="tab-button" onclick="showTab(\'all-results\')">All Results</button>'
     )
-
-    # Generate HTML
-    html = HTML_TEMPLATE
-    html = html.replace("{{test_run}}", data.get("test_run", "Unknown"))
-    html = html.replace("{{scale}}", str(data.get("scale", 0)))
-    html = html.replace("{{hierarchy}}", data.get("hierarchy", "unknown"))
-    html = html.replace("{{format_count}}", str(len(data.get("file_sizes", {}))))
-    html = html.replace("{{test_count}}", str(len(results)))
-    html = html.replace("{{tab_buttons}}", "\n".join(tab_buttons))
-    html = html.replace("{{tab_contents}}", "\n".join(tab_contents))
-    html = html.replace("{{json_data}}", json.dumps(data))
-    html = html.replace("{{chart_initialization}}", generate_chart_init(results))
-
-    with open(output_path, "w") as f:
-        f.write(html)
-
-    print(f"✓ HTML report generated: {output_path}")
+    write('<div id="all-results" class="tab-content">')
+    generate_all_results_table(write, rows)
+    write("</div>")
+
+    # Generate HTML, filling every placeholder in a single pass
+    subs = {
+        "style": _report_css(),
+        "test_run": data.get("test_run", "Unknown"),
+        "scale": str(data.get("scale", 0)),
+        "hierarchy": data.get("hierarchy", "unknown"),
+        "format_count": str(len(sorted_file_sizes)),
+        "test_count": str(len(results)),
+        "tab_buttons": tab_buttons.getvalue(),
+        "tab_contents": tab_contents.getvalue(),
+        "json_data": _dumps(embedded_data(data, results)),
+        "chart_initialization": generate_chart_init(rows, results_by_test),
+    }
+    html = render_page(subs)
+
+    # Encode once and write bytes for both the plain and the compressed copy
+    html_bytes = html.encode("utf-8")
+    output_path.write_bytes(html_bytes)
+
+    # Compressed copy alongside, for archiving or sharing
+    gzip_path = output_path.with_name(output_path.name + ".gz")
+    with gzip.open(gzip_path, "wb", compresslevel=6) as f:
+        f.write(html_bytes)
+
+    print(f"✓ HTML report generated: {output_path} (+ {gzip_path.name})")
 
 
 def main():
@@ -1198,8 +875,8 @@ def main():
         print(f"Error: No results file found: {json_path}")
         return
 
-    with open(json_path) as f:
-        data = json.load(f)
+    raw = json_path.read_bytes()
+    data = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
 
     # Generate HTML report
     html_path = results_dir / "benchmark_report.html"
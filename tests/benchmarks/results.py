@@ -2,14 +2,23 @@
 Core result collection utilities for benchmarks.
 """
 
+import array
+import gc
 import json
+import math
+import multiprocessing
 import os
+import platform
+import signal
 import statistics
 import time
-from dataclasses import asdict, dataclass, field
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import cached_property
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Iterator, Sequence
 
 # Try to import psutil for accurate cross-platform memory tracking
 try:
@@ -26,6 +35,35 @@ except ImportError:
     except ImportError:
         HAS_RESOURCE = False
 
+# Try to import orjson for faster serialization of results
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+# Try to import python-stapsdt to expose probes as USDT tracepoints
+try:
+    import stapsdt
+
+    HAS_STAPSDT = True
+except ImportError:
+    HAS_STAPSDT = False
+
+# Clock used for probe timestamps. Bound once at module level so the probe
+# hot path is a single global lookup rather than an attribute lookup on
+# the time module. perf_counter_ns reads CLOCK_MONOTONIC through the vDSO,
+# which is TSC-backed on x86_64 and CNTVCT-backed on aarch64.
+_clock_ns = time.perf_counter_ns
+
+# Bound once for flush_memory, which runs before every measurement
+_gc_collect = gc.collect
+
+# ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+_IS_DARWIN = platform.system() == "Darwin"
+
 # Try to import UsdUtils to clear stage cache
 try:
     from pxr import UsdUtils
@@ -35,19 +73,94 @@ except ImportError:
     HAS_USD_UTILS = False
 
 
+def _dumps(obj) -> bytes:
+    """Serialize to compact UTF-8 JSON, with orjson when it is available.
+
+    Dataclasses such as the ProbeResults in "detailed_probes" become JSON
+    objects of their fields: natively with orjson, via _as_json otherwise.
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj, default=_as_json).encode()
+
+
+def _as_json(obj) -> dict:
+    """json.dumps fallback for dataclass instances (e.g. ProbeResult)."""
+    if hasattr(obj, "__dataclass_fields__"):
+        return {name: getattr(obj, name) for name in obj.__dataclass_fields__}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+_usdt_provider = None
+_usdt_probe = None
+
+
+def _get_usdt_probe():
+    """Return the usd_parquet:probe_fired USDT probe, creating it on first use.
+
+    The provider is created once per process and shared by all trackers.
+    Returns None when python-stapsdt is unavailable or the provider fails
+    to load (e.g. unsupported platform).
+    """
+    global _usdt_provider, _usdt_probe, HAS_STAPSDT
+    if _usdt_probe is None and HAS_STAPSDT:
+        try:
+            provider = stapsdt.Provider("usd_parquet")
+            probe = provider.add_probe("probe_fired", stapsdt.ArgTypes.uint64)
+            provider.load()
+        except Exception:
+            HAS_STAPSDT = False
+        else:
+            _usdt_provider = provider
+            _usdt_probe = probe
+    return _usdt_probe
+
+
+def _memory_reader() -> Callable[[], int]:
+    """Return a function reading the current process RSS in bytes.
+
+    psutil is preferred; otherwise resource.getrusage on Unix, whose
+    ru_maxrss is in kilobytes on Linux and bytes on macOS. Returns a
+    constant 0 reader when neither is available.
+    """
+    if HAS_PSUTIL:
+        memory_info = psutil.Process(os.getpid()).memory_info
+        return lambda: memory_info().rss
+    if HAS_RESOURCE:
+        getrusage = resource.getrusage
+        scale = 1 if _IS_DARWIN else 1024
+        return lambda: getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+    return lambda: 0
+
+
 def flush_memory():
     """Force memory cleanup to ensure clean baseline for tests."""
     # 1. Force Python Garbage Collection
-    import gc
-
-    gc.collect()
+    _gc_collect()
 
     # 2. Clear USD Stage Cache
     if HAS_USD_UTILS:
         UsdUtils.StageCache.Get().Clear()
 
 
-@dataclass
+def drop_page_cache(*paths: str | Path) -> bool:
+    """Evict files from the OS page cache so the next read is a cold load.
+
+    Uses posix_fadvise(POSIX_FADV_DONTNEED), which is only available on
+    Linux; returns False without doing anything elsewhere.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return False
+    for path in paths:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    return True
+
+
+@dataclass(frozen=True, slots=True)
 class TimingResult:
     """Statistics from multiple timing runs."""
 
@@ -58,18 +171,35 @@ class TimingResult:
     run_count: int
 
     @classmethod
-    def from_times(cls, times: list[float]) -> "TimingResult":
-        """Create from a list of timing measurements."""
+    def from_times(cls, times: Sequence[float]) -> "TimingResult":
+        """Create from a list of timing measurements.
+
+        Mean, sample standard deviation, min and max are gathered in a single
+        pass, using Welford's update to keep the variance numerically stable.
+        """
+        mean = 0.0
+        m2 = 0.0
+        lo = hi = times[0]
+        for n, t in enumerate(times, 1):
+            delta = t - mean
+            mean += delta / n
+            m2 += delta * (t - mean)
+            if t < lo:
+                lo = t
+            elif t > hi:
+                hi = t
+
+        count = len(times)
         return cls(
-            mean_seconds=statistics.mean(times),
-            std_seconds=statistics.stdev(times) if len(times) > 1 else 0.0,
-            min_seconds=min(times),
-            max_seconds=max(times),
-            run_count=len(times),
+            mean_seconds=mean,
+            std_seconds=math.sqrt(m2 / (count - 1)) if count > 1 else 0.0,
+            min_seconds=lo,
+            max_seconds=hi,
+            run_count=count,
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MemoryResult:
     """Memory measurement result."""
 
@@ -77,7 +207,7 @@ class MemoryResult:
     peak_bytes: int
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProbeResult:
     """Result from a single probe measurement.
 
@@ -98,7 +228,125 @@ class ProbeResult:
     delta_since_last: int  # memory change since last probe (or start)
 
 
-@dataclass
+# Per-probe fields stored in "detailed_probes" and in the probe Parquet file
+PROBE_FIELDS = (
+    "label",
+    "elapsed_since_start",
+    "elapsed_since_last",
+    "total_memory_bytes",
+    "delta_since_start",
+    "delta_since_last",
+)
+
+
+# Environment variable selecting how many probes traversal workers record:
+# "min" (default) keeps only the start, load and finish probes, "detail"
+# adds the interior progress probes, which perturb the timed loop
+PROBE_MODE_ENV = "USD_BENCH_PROBES"
+
+
+def detailed_probes() -> bool:
+    """Whether interior progress probes are enabled for this process."""
+    return os.environ.get(PROBE_MODE_ENV, "min") == "detail"
+
+
+# Environment variable that lets the isolated runs of a benchmark overlap:
+# "1" runs them in parallel worker processes, which shortens the suite but
+# makes the runs compete for CPU and disk, so timings are not comparable
+PARALLEL_RUNS_ENV = "USD_BENCH_PARALLEL"
+
+
+def run_workers(num_runs: int) -> int:
+    """Worker processes to use for num_runs isolated runs (1 = serial)."""
+    if os.environ.get(PARALLEL_RUNS_ENV) != "1":
+        return 1
+    return max(1, min(num_runs, os.cpu_count() or 1))
+
+
+# Benchmark workers are forked where the platform allows it, so each one
+# inherits the loaded USD plugin and imported pxr modules from the pytest
+# process instead of re-importing them as spawn (the macOS default) would
+_WORKER_CONTEXT = multiprocessing.get_context(
+    "fork" if "fork" in multiprocessing.get_all_start_methods() else None
+)
+
+
+def isolated_pool(initializer=None, initargs=(), processes: int = 1):
+    """Pool that runs every task in its own freshly started worker process.
+
+    maxtasksperchild=1 gives each run clean USD caches, while the pool starts
+    the next worker as soon as a run ends. One worker at a time by default;
+    pass processes=run_workers(n) to honour USD_BENCH_PARALLEL.
+    """
+    return _WORKER_CONTEXT.Pool(
+        processes=processes,
+        maxtasksperchild=1,
+        initializer=initializer,
+        initargs=initargs,
+    )
+
+
+# Probes sent back from worker processes through shared memory are fixed
+# records of doubles: the label's index in a known label table followed by
+# the numeric ProbeResult fields (memory sizes stay exact below 2**53 bytes)
+_PROBE_RECORD_LEN = len(PROBE_FIELDS)
+
+
+def probe_buffer(runs: int, labels: Sequence[str]):
+    """Allocate a shared buffer with one slot of probe records per run.
+
+    Each slot holds one record per label. The buffer is a lock-free
+    multiprocessing.RawArray, so hand it to pool workers through the pool
+    initializer rather than with each task.
+    """
+    return _WORKER_CONTEXT.RawArray("d", runs * len(labels) * _PROBE_RECORD_LEN)
+
+
+def write_probes(
+    buffer, slot: int, probes: Sequence[ProbeResult], labels: Sequence[str]
+) -> int:
+    """Store a run's probes in its slot of a probe_buffer; returns the count."""
+    if len(probes) > len(labels):
+        raise ValueError(f"{len(probes)} probes do not fit a {len(labels)}-probe slot")
+    offset = slot * len(labels) * _PROBE_RECORD_LEN
+    for probe in probes:
+        buffer[offset : offset + _PROBE_RECORD_LEN] = [
+            labels.index(probe.label),
+            probe.elapsed_since_start,
+            probe.elapsed_since_last,
+            probe.total_memory_bytes,
+            probe.delta_since_start,
+            probe.delta_since_last,
+        ]
+        offset += _PROBE_RECORD_LEN
+    return len(probes)
+
+
+def read_probes(
+    buffer, slot: int, count: int, labels: Sequence[str]
+) -> list[ProbeResult]:
+    """Rebuild the probes a worker stored with write_probes."""
+    start = slot * len(labels) * _PROBE_RECORD_LEN
+    records = buffer[start : start + count * _PROBE_RECORD_LEN]
+    return [
+        ProbeResult(
+            label=labels[int(records[i])],
+            elapsed_since_start=records[i + 1],
+            elapsed_since_last=records[i + 2],
+            total_memory_bytes=int(records[i + 3]),
+            delta_since_start=int(records[i + 4]),
+            delta_since_last=int(records[i + 5]),
+        )
+        for i in range(0, len(records), _PROBE_RECORD_LEN)
+    ]
+
+
+# One probe row of the PerformanceTracker table: label, time, step time,
+# memory and memory step (MB)
+_PROBE_ROW_FORMAT = "{:<25} {:>10.4f}  {:>10.4f}  {:>10.2f}  {:>+10.2f}"
+
+
+@dataclass(slots=True)
 class BenchmarkResult:
     """A single benchmark measurement."""
 
@@ -114,10 +362,26 @@ class BenchmarkResult:
 class BenchmarkTimer:
     """Context manager for timing with statistics."""
 
-    def __init__(self, runs: int = 10, warmup: int = 1):
+    def __init__(
+        self,
+        runs: int = 10,
+        warmup: int = 1,
+        min_time: float | None = None,
+        max_runs: int = 100,
+        iterations: int = 1,
+    ):
         self.runs = runs
         self.warmup = warmup
-        self.times: list[float] = []
+        # Calls of func per run; each run's time is divided by this, so a
+        # setup's cost is amortized over several calls on its context
+        self.iterations = iterations
+        # When set, the run count is calibrated from the warmup runs so the
+        # measured runs take at least min_time seconds in total; runs is
+        # then the lower bound and max_runs the upper bound
+        self.min_time = min_time
+        self.max_runs = max_runs
+        # Seconds per measured run, as contiguous doubles
+        self.times: array.array = array.array("d")
 
     def measure(
         self,
@@ -131,28 +395,57 @@ class BenchmarkTimer:
             setup: Optional setup function called before each timed run. Its return
                    value is passed to func. Not included in timing. Use this to create
                    fresh stages with empty caches before each timing iteration.
+
+        Each run calls setup afresh, so calibration adds samples rather than
+        looping func on a warmed context. Only iterations > 1 repeats func on
+        the same context, and the reported times are then per call.
         """
-        # Warmup runs (discarded)
+        clock = _clock_ns
+        iterations = self.iterations
+        if iterations > 1:
+            once = func
+
+            def func(*args):
+                for _ in range(iterations):
+                    once(*args)
+
+        # Warmup runs (discarded, but timed for run-count calibration)
+        fastest_warmup_ns = 0
         for _ in range(self.warmup):
             if setup:
                 ctx = setup()
+                start = clock()
                 func(ctx)
             else:
+                start = clock()
                 func()
-
-        # Measured runs
-        self.times = []
-        for _ in range(self.runs):
-            if setup:
+            elapsed = clock() - start
+            if not fastest_warmup_ns or elapsed < fastest_warmup_ns:
+                fastest_warmup_ns = elapsed
+
+        runs = self.runs
+        if self.min_time is not None and fastest_warmup_ns > 0:
+            wanted = math.ceil(self.min_time * 1e9 / fastest_warmup_ns)
+            runs = max(self.runs, min(self.max_runs, wanted))
+
+        # Measured runs, timed in integer nanoseconds into a preallocated
+        # array and converted to seconds only once all runs are done. The
+        # setup check is hoisted so each loop body is only the timed call.
+        elapsed_ns = array.array("q", [0]) * runs
+        if setup:
+            for i in range(runs):
                 ctx = setup()
-                start = time.perf_counter()
+                start = clock()
                 func(ctx)
-            else:
-                start = time.perf_counter()
+                elapsed_ns[i] = clock() - start
+        else:
+            for i in range(runs):
+                start = clock()
                 func()
-            elapsed = time.perf_counter() - start
-            self.times.append(elapsed)
+                elapsed_ns[i] = clock() - start
 
+        scale = 1e-9 / iterations
+        self.times = array.array("d", [ns * scale for ns in elapsed_ns])
         return TimingResult.from_times(self.times)
 
 
@@ -165,7 +458,9 @@ class PerformanceTracker:
     
     Features:
     - Automatic timing from entry to exit
-    - Memory tracking (RSS) throughout execution
+    - Memory tracking (RSS), sampled only on entry, at probes and on exit;
+      there is no per-allocation tracing (e.g. tracemalloc), so the code
+      between probes runs unperturbed
     - Probe points to measure intermediate states
     - Detailed reporting of memory deltas and timing between probes
     
@@ -186,54 +481,97 @@ class PerformanceTracker:
         # Or access via tracker.probes list
     """
 
-    def __init__(self, name: str = "measurement", verbose: bool = True):
+    def __init__(
+        self,
+        name: str = "measurement",
+        verbose: bool = True,
+        calibration_runs: int = 200,
+        expected_probes: int = 16,
+    ):
         """Initialize performance tracker.
 
         Args:
             name: Name for this measurement (used in output)
             verbose: If True, print results on exit
+            calibration_runs: Number of empty probe cycles used to calibrate
+                probe overhead on entry (0 disables calibration)
+            expected_probes: Probe slots to preallocate, so probes inside the
+                measured region do not grow the list (more still fit)
         """
         self.name = name
         self.verbose = verbose
+        self.calibration_runs = calibration_runs
 
         # Legacy result for backward compatibility
         self.result: MemoryResult | None = None
 
-        # New probe-based results
-        self.probes: list[ProbeResult] = []
+        # New probe-based results, written by index into preallocated slots
+        # (see the probes property)
+        self._probes: list[ProbeResult | None] = [None] * expected_probes
+        self._probe_count: int = 0
 
-        # Internal state
-        self._start_time: float = 0
+        # Internal state (timestamps are integer nanoseconds from _clock_ns)
+        self._start_ns: int = 0
         self._start_memory: int = 0
-        self._last_time: float = 0
+        self._last_ns: int = 0
         self._last_memory: int = 0
-        self._total_probe_overhead: float = 0  # Accumulated measurement overhead
-
-    def _get_process_memory(self) -> int:
-        """Get current process RSS (Resident Set Size) in bytes."""
-        if HAS_PSUTIL:
-            # psutil provides cross-platform memory info
-            process = psutil.Process(os.getpid())
-            return process.memory_info().rss
-        elif HAS_RESOURCE:
-            # resource.getrusage on Unix (macOS/Linux)
-            # ru_maxrss is in kilobytes on Linux, bytes on macOS
-            import platform
-
-            usage = resource.getrusage(resource.RUSAGE_SELF)
-            if platform.system() == "Darwin":  # macOS
-                return usage.ru_maxrss  # Already in bytes
-            else:  # Linux
-                return usage.ru_maxrss * 1024  # Convert KB to bytes
-        else:
-            # No memory tracking available
-            return 0
+        self._total_probe_overhead_ns: int = 0  # Accumulated measurement overhead
+
+        # Calibrated overheads (see _calibrate): inner is the cost seen between
+        # the two timestamps of a probe, outer is the cost of the timestamps
+        # themselves, which is invisible to the per-probe measurement.
+        self._inner_overhead_ns: int = 0
+        self._outer_overhead_ns: int = 0
+
+        # USDT tracepoint fired on every probe (None if unavailable)
+        self._usdt = _get_usdt_probe()
+
+        # RSS reader for this platform, bound once in __enter__ (in the process
+        # that measures) so the probe path does not branch on what is available
+        self._read_memory: Callable[[], int] | None = None
+
+    @property
+    def probes(self) -> list[ProbeResult]:
+        """Probes recorded so far, in order."""
+        return self._probes[: self._probe_count]
+
+    @property
+    def _total_probe_overhead(self) -> float:
+        """Accumulated probe measurement overhead in seconds."""
+        return self._total_probe_overhead_ns * 1e-9
+
+    def _calibrate(self) -> None:
+        """Measure inner and outer probe overhead with two nested timers.
+
+        The inner timer brackets the memory read exactly as probe() does; the
+        outer timer brackets the inner one. The median difference is the cost
+        of taking the inner timestamps, which probe() cannot observe directly
+        and so must subtract as a calibrated constant.
+        """
+        inner = []
+        outer = []
+        for _ in range(self.calibration_runs):
+            outer_before = _clock_ns()
+            ns_before = _clock_ns()
+            self._read_memory()
+            ns_after = _clock_ns()
+            outer_after = _clock_ns()
+            inner.append(ns_after - ns_before)
+            outer.append(outer_after - outer_before)
+
+        self._inner_overhead_ns = int(statistics.median(inner))
+        self._outer_overhead_ns = max(
+            0, int(statistics.median(outer)) - self._inner_overhead_ns
+        )
 
     def __enter__(self):
         """Start measurement."""
-        self._start_time = time.perf_counter()
-        self._start_memory = self._get_process_memory()
-        self._last_time = self._start_time
+        self._read_memory = _memory_reader()
+        if self.calibration_runs > 0:
+            self._calibrate()
+        self._start_memory = self._read_memory()
+        self._start_ns = _clock_ns()
+        self._last_ns = self._start_ns
         self._last_memory = self._start_memory
         return self
 
@@ -252,23 +590,33 @@ class PerformanceTracker:
             ProbeResult with timing and memory deltas
         """
         # Measure time before memory check
-        time_before = time.perf_counter()
+        ns_before = _clock_ns()
+
+        # Fire the USDT tracepoint inside the overhead window so its cost is
+        # excluded like the memory read (a nop when no tracer is attached)
+        if self._usdt is not None:
+            self._usdt.fire(label)
 
         # Get memory (this may take a moment)
-        current_memory = self._get_process_memory()
+        current_memory = self._read_memory()
 
         # Measure time after memory check
-        time_after = time.perf_counter()
-        measurement_overhead = time_after - time_before
+        ns_after = _clock_ns()
 
-        # Accumulate total overhead
-        self._total_probe_overhead += measurement_overhead
+        # Accumulate total overhead (integer ns, so no rounding drift): the
+        # measured memory read plus the calibrated cost of the timestamps
+        self._total_probe_overhead_ns += (
+            ns_after - ns_before + self._outer_overhead_ns
+        )
 
-        # Calculate timing (excluding all accumulated measurement overhead)
+        # Calculate timing (excluding all accumulated measurement overhead);
+        # convert to float seconds only at the reporting boundary
         elapsed_since_start = (
-            time_before - self._start_time - self._total_probe_overhead
-        )
-        elapsed_since_last = time_before - self._last_time
+            ns_after - self._start_ns - self._total_probe_overhead_ns
+        ) * 1e-9
+        elapsed_since_last = (
+            ns_before - self._last_ns - self._outer_overhead_ns
+        ) * 1e-9
 
         # Calculate memory deltas
         delta_since_start = current_memory - self._start_memory
@@ -283,10 +631,14 @@ class PerformanceTracker:
             delta_since_last=delta_since_last,
         )
 
-        self.probes.append(probe)
+        try:
+            self._probes[self._probe_count] = probe
+        except IndexError:
+            self._probes.append(probe)
+        self._probe_count += 1
 
-        # Update last measurements (use time_after to account for overhead in next delta)
-        self._last_time = time_after
+        # Update last measurements (use ns_after to account for overhead in next delta)
+        self._last_ns = ns_after
         self._last_memory = current_memory
 
         return probe
@@ -294,11 +646,11 @@ class PerformanceTracker:
     def __exit__(self, *args):
         """Finish measurement and optionally print results."""
         # Take final measurement
-        end_time = time.perf_counter()
-        end_memory = self._get_process_memory()
+        end_ns = _clock_ns()
+        end_memory = self._read_memory()
 
         # Calculate totals
-        total_elapsed = end_time - self._start_time
+        total_elapsed = (end_ns - self._start_ns) * 1e-9
         total_delta = end_memory - self._start_memory
 
         # Set legacy result for backward compatibility
@@ -312,32 +664,190 @@ class PerformanceTracker:
 
     def _print_results(self, total_elapsed: float, total_delta: int):
         """Print formatted probe results."""
-        print(f"\n{'=' * 70}")
-        print(f"Performance Measurement: {self.name}")
-        print(f"{'=' * 70}")
-        print(
-            f"{'Probe':<25} {'Time (s)':<12} {'Δt (s)':<12} {'Mem (MB)':<12} {'ΔMem (MB)':<12}"
+        inv_mb = 1.0 / (1024 * 1024)
+        row = _PROBE_ROW_FORMAT.format
+        lines = [
+            f"\n{'=' * 70}",
+            f"Performance Measurement: {self.name}",
+            f"{'=' * 70}",
+            f"{'Probe':<25} {'Time (s)':<12} {'Δt (s)':<12} {'Mem (MB)':<12} {'ΔMem (MB)':<12}",
+            f"{'-' * 70}",
+        ]
+        lines.extend(
+            [
+                row(
+                    p.label,
+                    p.elapsed_since_start,
+                    p.elapsed_since_last,
+                    p.total_memory_bytes * inv_mb,
+                    p.delta_since_last * inv_mb,
+                )
+                for p in self.probes
+            ]
         )
-        print(f"{'-' * 70}")
-
-        for probe in self.probes:
-            print(
-                f"{probe.label:<25} "
-                f"{probe.elapsed_since_start:>10.4f}  "
-                f"{probe.elapsed_since_last:>10.4f}  "
-                f"{probe.total_memory_bytes / (1024 * 1024):>10.2f}  "
-                f"{probe.delta_since_last / (1024 * 1024):>+10.2f}"
-            )
-
-        print(f"{'-' * 70}")
-        print(
+        lines.append(f"{'-' * 70}")
+        lines.append(
             f"{'TOTAL':<25} "
             f"{total_elapsed:>10.4f}  "
             f"{'':>10}  "
             f"{'':>10}  "
-            f"{total_delta / (1024 * 1024):>+10.2f}"
+            f"{total_delta * inv_mb:>+10.2f}"
+        )
+        lines.append(f"{'=' * 70}\n")
+
+        # One write for the whole table rather than one print per line
+        print("\n".join(lines))
+
+
+# Zone currently active for SamplingTracker; read from the SIGPROF handler
+_active_zone: ContextVar[str] = ContextVar("sampling_zone", default="untracked")
+
+
+class SamplingTracker:
+    """Context manager for statistical CPU-time attribution to labelled zones.
+
+    Unlike PerformanceTracker, nothing is measured on the code path itself:
+    a POSIX profiling timer (ITIMER_PROF) fires every `interval` seconds of
+    process CPU time and the signal handler counts one sample against the
+    currently active zone. The cost per zone is therefore constant no matter
+    how many iterations run inside it, which makes this suitable for hot
+    loops where per-step probes would distort the measurement.
+
+    Only available on Unix, and only from the main thread (a restriction of
+    Python signal handling). Time spent sleeping or blocked on I/O is not
+    sampled.
+
+    Example:
+        with SamplingTracker(name="traversal") as tracker:
+            with tracker.zone("open"):
+                stage = Usd.Stage.Open("scene.usd")
+            with tracker.zone("read"):
+                for prim in stage.Traverse():
+                    prim.GetAttribute("payload").Get()
+
+        # tracker.zone_seconds -> {"open": 0.012, "read": 1.734}
+    """
+
+    def __init__(
+        self, name: str = "sampling", interval: float = 1e-3, verbose: bool = True
+    ):
+        """Initialize sampling tracker.
+
+        Args:
+            name: Name for this measurement (used in output)
+            interval: Sampling interval in seconds of process CPU time
+            verbose: If True, print results on exit
+        """
+        self.name = name
+        self.interval = interval
+        self.verbose = verbose
+
+        # Sample counts per zone label, filled in by the signal handler
+        self.samples: dict[str, int] = {}
+        # Estimated CPU seconds per zone, available after exit
+        self.zone_seconds: dict[str, float] = {}
+
+        self._previous_handler = None
+
+    @contextmanager
+    def zone(self, label: str) -> Iterator[None]:
+        """Attribute samples taken inside this block to `label`."""
+        token = _active_zone.set(label)
+        try:
+            yield
+        finally:
+            _active_zone.reset(token)
+
+    def _on_sample(self, signum, frame) -> None:
+        """SIGPROF handler: count one sample against the active zone."""
+        zone = _active_zone.get()
+        self.samples[zone] = self.samples.get(zone, 0) + 1
+
+    def __enter__(self):
+        """Install the handler and start the profiling timer."""
+        if not hasattr(signal, "setitimer"):
+            raise RuntimeError("SamplingTracker requires signal.setitimer (Unix only)")
+
+        self._previous_handler = signal.signal(signal.SIGPROF, self._on_sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        return self
+
+    def __exit__(self, *args):
+        """Stop the timer, restore the previous handler and compute totals."""
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(signal.SIGPROF, self._previous_handler or signal.SIG_DFL)
+
+        self.zone_seconds = {
+            zone: count * self.interval for zone, count in self.samples.items()
+        }
+
+        if self.verbose and self.samples:
+            self._print_results()
+
+    def _print_results(self):
+        """Print formatted per-zone sample counts."""
+        total_samples = sum(self.samples.values())
+        zone_seconds = self.zone_seconds
+
+        lines = [
+            f"\n{'=' * 70}",
+            f"Sampling Measurement: {self.name}",
+            f"{'=' * 70}",
+            f"{'Zone':<25} {'Samples':>10} {'CPU (s)':>12} {'Share':>10}",
+            f"{'-' * 70}",
+        ]
+        lines.extend(
+            [
+                f"{zone:<25} "
+                f"{count:>10} "
+                f"{zone_seconds[zone]:>12.4f} "
+                f"{count / total_samples:>10.1%}"
+                for zone, count in self.samples.items()
+            ]
         )
-        print(f"{'=' * 70}\n")
+        lines.append(f"{'-' * 70}")
+        lines.append(
+            f"{'TOTAL':<25} "
+            f"{total_samples:>10} "
+            f"{total_samples * self.interval:>12.4f}"
+        )
+        lines.append(f"{'=' * 70}\n")
+
+        # One write for the whole table rather than one print per line
+        print("\n".join(lines))
+
+
+def _result_to_dict(r: BenchmarkResult) -> dict:
+    """Flatten a result into the row format used in the JSON outputs."""
+    timing = r.timing
+    memory = r.memory
+    if timing is not None and memory is not None:
+        # Common case: a full measurement, read without per-field checks
+        return {
+            "test": r.test_name,
+            "format": r.format_name,
+            "mean_seconds": timing.mean_seconds,
+            "std_seconds": timing.std_seconds,
+            "min_seconds": timing.min_seconds,
+            "max_seconds": timing.max_seconds,
+            "run_count": timing.run_count,
+            "current_memory_bytes": memory.current_bytes,
+            "peak_memory_bytes": memory.peak_bytes,
+            **r.extra,
+        }
+    # Partial result: timing or memory may be missing
+    return {
+        "test": r.test_name,
+        "format": r.format_name,
+        "mean_seconds": timing.mean_seconds if timing else None,
+        "std_seconds": timing.std_seconds if timing else None,
+        "min_seconds": timing.min_seconds if timing else None,
+        "max_seconds": timing.max_seconds if timing else None,
+        "run_count": timing.run_count if timing else None,
+        "current_memory_bytes": memory.current_bytes if memory else None,
+        "peak_memory_bytes": memory.peak_bytes if memory else None,
+        **r.extra,
+    }
 
 
 class ResultCollector:
@@ -348,7 +858,34 @@ class ResultCollector:
         self.hierarchy = hierarchy
         self.results: list[BenchmarkResult] = []
         self.file_sizes: dict[str, int] = {}
-        self.test_run = datetime.now().isoformat()
+        # Wall-clock start of the run; formatted lazily by test_run
+        self._started = time.time()
+        # Flattened probe rows kept column-wise (one list per field) so they
+        # can be handed to Arrow without a per-row conversion
+        self.probe_columns: dict[str, list] = {
+            name: [] for name in ("test", "format", "run", "probe_index", *PROBE_FIELDS)
+        }
+        # Optional JSON-Lines file each result is appended to as it arrives
+        self._stream = None
+
+    @cached_property
+    def test_run(self) -> str:
+        """ISO timestamp of when this collector was created."""
+        return datetime.fromtimestamp(self._started).isoformat()
+
+    def open_stream(self, output_path: Path) -> None:
+        """Start writing each added result to a JSON-Lines file.
+
+        Every line is flushed as soon as it is written, so results gathered
+        before a crash are not lost.
+        """
+        self._stream = open(output_path, "wb")
+
+    def close_stream(self) -> None:
+        """Stop streaming results and close the JSON-Lines file."""
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
 
     def add_file_size(self, format_name: str, size_bytes: int) -> None:
         """Record a file size measurement."""
@@ -358,6 +895,20 @@ class ResultCollector:
         """Add a benchmark result."""
         self.results.append(result)
 
+        if self._stream is not None:
+            self._stream.write(_dumps(_result_to_dict(result)) + b"\n")
+            self._stream.flush()
+
+        columns = self.probe_columns
+        for run_index, run in enumerate(result.extra.get("detailed_probes", ())):
+            for probe_index, probe in enumerate(run):
+                columns["test"].append(result.test_name)
+                columns["format"].append(result.format_name)
+                columns["run"].append(run_index)
+                columns["probe_index"].append(probe_index)
+                for name in PROBE_FIELDS:
+                    columns[name].append(getattr(probe, name))
+
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
         return {
@@ -365,31 +916,51 @@ class ResultCollector:
             "scale": self.scale,
             "hierarchy": self.hierarchy,
             "file_sizes": self.file_sizes,
-            "results": [
-                {
-                    "test": r.test_name,
-                    "format": r.format_name,
-                    "mean_seconds": r.timing.mean_seconds if r.timing else None,
-                    "std_seconds": r.timing.std_seconds if r.timing else None,
-                    "min_seconds": r.timing.min_seconds if r.timing else None,
-                    "max_seconds": r.timing.max_seconds if r.timing else None,
-                    "run_count": r.timing.run_count if r.timing else None,
-                    "current_memory_bytes": r.memory.current_bytes
-                    if r.memory
-                    else None,
-                    "peak_memory_bytes": r.memory.peak_bytes if r.memory else None,
-                    **r.extra,
-                }
-                for r in self.results
-            ],
+            "results": [_result_to_dict(r) for r in self.results],
         }
 
     def save_json(self, output_path: Path) -> None:
-        """Save results to JSON file."""
-        with open(output_path, "w") as f:
-            json.dump(self.to_dict(), f, indent=2)
+        """Save results to JSON file.
+
+        Results are flattened and written one per line as they are
+        serialized, so the full list of row dicts is never held in memory.
+        The file holds the same document as to_dict().
+        """
+        header = {
+            "test_run": self.test_run,
+            "scale": self.scale,
+            "hierarchy": self.hierarchy,
+            "file_sizes": self.file_sizes,
+        }
+        with open(output_path, "wb") as f:
+            f.write(b"{\n")
+            for key, value in header.items():
+                f.write(b"  %s: %s,\n" % (_dumps(key), _dumps(value)))
+            f.write(b'  "results": [')
+            separator = b"\n    "
+            for r in self.results:
+                f.write(separator)
+                f.write(_dumps(_result_to_dict(r)))
+                separator = b",\n    "
+            f.write(b"\n  ]\n}\n")
         print(f"Results saved to {output_path}")
 
+    def save_parquet(self, output_path: Path) -> None:
+        """Save all probe rows to a zstd-compressed Parquet file.
+
+        One row per probe, with test/format/run/probe_index identifying it.
+        Floats round-trip at full precision.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.table(self.probe_columns)
+        table = table.append_column(
+            "scale", pa.repeat(self.scale, table.num_rows)
+        ).append_column("hierarchy", pa.repeat(self.hierarchy, table.num_rows))
+        pq.write_table(table, output_path, compression="zstd")
+        print(f"Probes saved to {output_path}")
+
 
 # Global collector instance (set by conftest.py)
 _collector: ResultCollector | None = None
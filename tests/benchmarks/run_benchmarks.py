@@ -17,47 +17,167 @@ Usage:
 
     # Skip data generation (if already exists)
     uv run python tests/benchmarks/run_benchmarks.py --skip-generate
+
+    # Regenerate data even if the manifest says it is up to date
+    uv run python tests/benchmarks/run_benchmarks.py --force-generate
+
+    # Run the data generator in its own process rather than in this one
+    uv run python tests/benchmarks/run_benchmarks.py --isolate
+
+    # Run up to 3 configurations at once (timings will contend for the CPU)
+    uv run python tests/benchmarks/run_benchmarks.py --jobs 3
+
+    # Evict inputs from the page cache before every load run (Linux only)
+    uv run python tests/benchmarks/run_benchmarks.py --cold
+
+    # Record interior progress probes during traversals
+    uv run python tests/benchmarks/run_benchmarks.py --detailed-probes
 """
 
 import argparse
+import hashlib
+import json
 import subprocess
 import sys
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # Benchmark configurations
 SCALES = [1000, 10000, 100000]
 HIERARCHIES = ["flat", "deep"]
 
+# Repository root (commands run from here) and the generated data location
+REPO_ROOT = Path(__file__).parent.parent.parent
+DATA_DIR = REPO_ROOT / "tests" / "data" / "benchmarks"
+
+# Generator script; its hash is part of each configuration's data manifest
+GENERATOR = Path(__file__).parent / "generate_test_data.py"
+MANIFEST_NAME = ".manifest.json"
+
+
+# Set when configurations run concurrently: command output is then captured
+# and printed in one block per command so runs don't interleave
+_capture_output = False
+_print_lock = threading.Lock()
+
 
 def run_command(cmd: list[str], description: str) -> bool:
     """Run a command and return success status."""
-    print(f"\n{'=' * 60}")
-    print(f"🔹 {description}")
-    print(f"{'=' * 60}")
-    print(f"$ {' '.join(cmd)}\n")
+    header = f"\n{'=' * 60}\n🔹 {description}\n{'=' * 60}\n$ {' '.join(cmd)}\n"
+    cwd = REPO_ROOT
+
+    if not _capture_output:
+        print(header)
+        result = subprocess.run(cmd, cwd=cwd)
+        return result.returncode == 0
 
-    result = subprocess.run(cmd, cwd=Path(__file__).parent.parent.parent)
+    result = subprocess.run(
+        cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+    )
+    with _print_lock:
+        print(header)
+        print(result.stdout, end="", flush=True)
     return result.returncode == 0
 
 
-def generate_test_data(scale: int, hierarchy: str) -> bool:
-    """Generate test data for a specific scale and hierarchy."""
+def _generated_files(data_dir: Path) -> list[Path]:
+    """Files written by generate_test_data.py in a configuration directory."""
+    return sorted(
+        p
+        for p in data_dir.iterdir()
+        if p.name in ("base_scene.usda", "_table.arrow")
+        or p.name.startswith("properties")
+    )
+
+
+def _build_manifest(data_dir: Path) -> dict:
+    """Generator hash plus size and mtime of every generated file."""
+    files = {}
+    for path in _generated_files(data_dir):
+        st = path.stat()
+        files[path.name] = [st.st_size, st.st_mtime_ns]
+    return {
+        "generator_sha256": hashlib.sha256(GENERATOR.read_bytes()).hexdigest(),
+        "files": files,
+    }
+
+
+def _manifest_valid(scale: int, hierarchy: str) -> bool:
+    """True if the data for this configuration is unchanged since it was made."""
+    data_dir = DATA_DIR / f"{scale}_{hierarchy}"
+    try:
+        recorded = json.loads((data_dir / MANIFEST_NAME).read_text())
+        return recorded == _build_manifest(data_dir)
+    except (OSError, ValueError):
+        return False
+
+
+def _write_manifest(scale: int, hierarchy: str) -> None:
+    """Record the current generator and generated files for a configuration."""
+    data_dir = DATA_DIR / f"{scale}_{hierarchy}"
+    manifest = _build_manifest(data_dir)
+    (data_dir / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2))
+
+
+def _missing_files(scale: int, hierarchy: str) -> list[str]:
+    """Expected data files that are absent for this configuration."""
+    from generate_test_data import expected_files
+
+    data_dir = DATA_DIR / f"{scale}_{hierarchy}"
+    return [name for name in expected_files(scale) if not (data_dir / name).exists()]
+
+
+def generate_test_data(
+    scale: int, hierarchy: str, force: bool = False, isolate: bool = False
+) -> bool:
+    """Generate test data for a specific scale and hierarchy.
+
+    Runs the generator in this process, which already has the project's
+    environment, unless isolate is set; then it runs as a uv subprocess.
+    """
+    if not isolate:
+        # This file runs as a script, so its directory is on sys.path
+        import generate_test_data as generator
+
+        print(
+            f"\n{'=' * 60}\n🔹 Generating test data: {scale} prims, "
+            f"{hierarchy} hierarchy (in process)\n{'=' * 60}"
+        )
+        try:
+            return generator.generate(
+                scale, hierarchy, output_dir=DATA_DIR, force=force
+            )
+        except Exception:
+            traceback.print_exc()
+            return False
+
+    cmd = [
+        "uv",
+        "run",
+        "python",
+        "tests/benchmarks/generate_test_data.py",
+        "--scale",
+        str(scale),
+        "--hierarchy",
+        hierarchy,
+    ]
+    if force:
+        cmd.append("--force")
+
     return run_command(
-        [
-            "uv",
-            "run",
-            "python",
-            "tests/benchmarks/generate_test_data.py",
-            "--scale",
-            str(scale),
-            "--hierarchy",
-            hierarchy,
-        ],
-        f"Generating test data: {scale} prims, {hierarchy} hierarchy",
+        cmd, f"Generating test data: {scale} prims, {hierarchy} hierarchy"
     )
 
 
-def run_benchmarks(scale: int, hierarchy: str, test_filter: str | None = None) -> bool:
+def run_benchmarks(
+    scale: int,
+    hierarchy: str,
+    test_filter: str | None = None,
+    cache: str = "warm",
+    detailed_probes: bool = False,
+) -> bool:
     """Run pytest benchmarks for a specific scale and hierarchy."""
     cmd = [
         "uv",
@@ -65,10 +185,16 @@ def run_benchmarks(scale: int, hierarchy: str, test_filter: str | None = None) -
         "pytest",
         "tests/benchmarks/",
         "-v",
+        # Nothing here reruns failures or reads the cache, so skip writing it
+        "-p",
+        "no:cacheprovider",
         f"--benchmark-scale={scale}",
         f"--benchmark-hierarchy={hierarchy}",
+        f"--benchmark-cache={cache}",
     ]
 
+    if detailed_probes:
+        cmd.append("--detailed-probes")
     if test_filter:
         cmd.extend(["-k", test_filter])
 
@@ -79,9 +205,14 @@ def run_benchmarks(scale: int, hierarchy: str, test_filter: str | None = None) -
     )
 
 
-def generate_report(scale: int, hierarchy: str) -> bool:
-    """Generate HTML report for a specific scale and hierarchy."""
-    return run_command(
+def start_report(scale: int, hierarchy: str) -> subprocess.Popen:
+    """Start HTML report generation for a configuration without waiting.
+
+    The report only reads the results already written, so it can run while
+    the next configuration's benchmarks do. Its output is captured and
+    printed by finish_report.
+    """
+    return subprocess.Popen(
         [
             "uv",
             "run",
@@ -92,10 +223,66 @@ def generate_report(scale: int, hierarchy: str) -> bool:
             "--hierarchy",
             hierarchy,
         ],
-        f"Generating report: {scale} prims, {hierarchy} hierarchy",
+        cwd=REPO_ROOT,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
     )
 
 
+def finish_report(config: str, proc: subprocess.Popen) -> bool:
+    """Wait for a report started by start_report and print its output."""
+    output, _ = proc.communicate()
+    with _print_lock:
+        print(f"\n{'=' * 60}\n🔹 Generated report: {config}\n{'=' * 60}")
+        print(output, end="", flush=True)
+    return proc.returncode == 0
+
+
+def run_config(
+    scale: int, hierarchy: str, args: argparse.Namespace
+) -> tuple[str, subprocess.Popen | None]:
+    """Generate data, run benchmarks and start the report for one configuration.
+
+    Returns the configuration's status (SUCCESS or the step that failed) and
+    the still-running report process, if one was started.
+    """
+    config = f"{scale}_{hierarchy}"
+    print(f"\n\n{'#' * 60}")
+    print(f"# Configuration: {config}")
+    print(f"{'#' * 60}")
+
+    # Generate test data, unless the manifest shows it is already current
+    if args.skip_generate:
+        pass
+    elif not args.force_generate and _manifest_valid(scale, hierarchy):
+        print(f"\n✓ Test data for {config} is up to date (manifest matches)")
+    else:
+        if not generate_test_data(
+            scale, hierarchy, force=args.force_generate, isolate=args.isolate
+        ):
+            print(f"❌ Failed to generate data for {config}")
+            return "GENERATE_FAILED", None
+        _write_manifest(scale, hierarchy)
+
+    # Run benchmarks, unless the data is incomplete: pytest would only skip
+    if not args.skip_tests:
+        missing = _missing_files(scale, hierarchy)
+        if missing:
+            print(f"❌ Missing test data for {config}: {', '.join(missing)}")
+            return "MISSING_FILES", None
+        cache = "cold" if args.cold else "warm"
+        if not run_benchmarks(
+            scale, hierarchy, args.filter, cache, args.detailed_probes
+        ):
+            print(f"❌ Benchmarks failed for {config}")
+            return "TESTS_FAILED", None
+
+    # Generate report in the background; main() waits for it at the end
+    print(f"\n✅ Completed: {config} (report generating in background)")
+    return "SUCCESS", start_report(scale, hierarchy)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Run complete Parquet vs USDC benchmark suite"
@@ -120,6 +307,11 @@ def main():
         action="store_true",
         help="Skip test data generation (use existing files)",
     )
+    parser.add_argument(
+        "--force-generate",
+        action="store_true",
+        help="Regenerate test data even if its manifest is up to date",
+    )
     parser.add_argument(
         "--skip-tests",
         action="store_true",
@@ -130,6 +322,31 @@ def main():
         type=str,
         help="Run only tests matching this string pattern (e.g. 'initial_load')",
     )
+    parser.add_argument(
+        "--cold",
+        action="store_true",
+        help="Evict benchmark inputs from the OS page cache before every load "
+        "run (Linux only); by default loads are measured with a warm cache",
+    )
+    parser.add_argument(
+        "--detailed-probes",
+        action="store_true",
+        help="Record interior progress probes during traversals; off by "
+        "default because each probe perturbs the timed loop",
+    )
+    parser.add_argument(
+        "--isolate",
+        action="store_true",
+        help="Run the data generator as a separate uv process instead of in "
+        "this one (always the case with --jobs above 1)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Configurations to run concurrently (default: 1). Concurrent runs "
+        "compete for CPU and disk, so use 1 for timings you intend to compare",
+    )
     args = parser.parse_args()
 
     print("=" * 60)
@@ -139,37 +356,43 @@ def main():
     print(f"Hierarchies: {args.hierarchies}")
     print(f"Total configurations: {len(args.scales) * len(args.hierarchies)}")
 
+    configs = [
+        (scale, hierarchy) for scale in args.scales for hierarchy in args.hierarchies
+    ]
+    jobs = max(1, min(args.jobs, len(configs)))
+    # The generator draws from one module-level random generator, so
+    # concurrent configurations must each generate in their own process
+    args.isolate = args.isolate or jobs > 1
+
+    if jobs == 1:
+        outcomes = {
+            f"{scale}_{hierarchy}": run_config(scale, hierarchy, args)
+            for scale, hierarchy in configs
+        }
+    else:
+        # Each configuration is a chain of subprocesses, so threads are
+        # enough to drive them; report in configuration order afterwards
+        global _capture_output
+        _capture_output = True
+        outcomes = {}
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            futures = {
+                executor.submit(
+                    run_config, scale, hierarchy, args
+                ): f"{scale}_{hierarchy}"
+                for scale, hierarchy in configs
+            }
+            for future in as_completed(futures):
+                outcomes[futures[future]] = future.result()
+
+    # Wait for the background reports; report in configuration order
     results = []
-
-    for scale in args.scales:
-        for hierarchy in args.hierarchies:
-            config = f"{scale}_{hierarchy}"
-            print(f"\n\n{'#' * 60}")
-            print(f"# Configuration: {config}")
-            print(f"{'#' * 60}")
-
-            # Generate test data
-            if not args.skip_generate:
-                if not generate_test_data(scale, hierarchy):
-                    print(f"❌ Failed to generate data for {config}")
-                    results.append((config, "GENERATE_FAILED"))
-                    continue
-
-            # Run benchmarks
-            if not args.skip_tests:
-                if not run_benchmarks(scale, hierarchy, args.filter):
-                    print(f"❌ Benchmarks failed for {config}")
-                    results.append((config, "TESTS_FAILED"))
-                    continue
-
-            # Generate report
-            if not generate_report(scale, hierarchy):
-                print(f"⚠️  Report generation failed for {config}")
-                results.append((config, "REPORT_FAILED"))
-                continue
-
-            results.append((config, "SUCCESS"))
-            print(f"\n✅ Completed: {config}")
+    for config in (f"{scale}_{hierarchy}" for scale, hierarchy in configs):
+        status, report_proc = outcomes[config]
+        if report_proc is not None and not finish_report(config, report_proc):
+            print(f"⚠️  Report generation failed for {config}")
+            status = "REPORT_FAILED"
+        results.append((config, status))
 
     # Summary
     print("\n\n" + "=" * 60)
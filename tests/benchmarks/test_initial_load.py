@@ -5,45 +5,70 @@ Measures time and memory for cold loading a property sublayer into a stage.
 Uses probes to measure different stages of the loading process.
 """
 
-import multiprocessing
 import time
+from functools import partial
 from pathlib import Path
 
 import pytest
 from pxr import Usd
 
-from .results import BenchmarkResult, MemoryResult, PerformanceTracker, TimingResult
+from .results import (
+    BenchmarkResult,
+    MemoryResult,
+    PerformanceTracker,
+    TimingResult,
+    drop_page_cache,
+    isolated_pool,
+    probe_buffer,
+    read_probes,
+    write_probes,
+)
+
+# Probes recorded by every run, in order; workers store label indexes
+PROBE_LABELS = ("start", "base_and_sublayer_added", "composition_complete")
+
+# Shared probe buffer, installed in each pool worker by _init_worker
+_probe_buffer = None
+
+
+def _init_worker(buffer):
+    """Pool initializer: keep the shared probe buffer for the tasks."""
+    global _probe_buffer
+    _probe_buffer = buffer
 
 
 def _run_single_iteration(
-    base_scene_path_str, prop_path_str, format_name, run_index, result_queue
+    base_scene_path_str, prop_path_str, format_name, cold, run_index
 ):
-    """Run a single iteration in a separate process."""
-    try:
-        with PerformanceTracker(
-            name=f"{format_name} Run {run_index}", verbose=False
-        ) as tracker:
-            # 1. Start probe (baseline)
-            tracker.probe("start")
+    """Run a single iteration in a pool worker.
+
+    The probes are written to the run's slot of the shared probe buffer
+    instead of being pickled back; only their count is returned.
 
-            # 2. Open base scene (loads base layer)
-            stage = Usd.Stage.Open(base_scene_path_str)
-            root_layer = stage.GetRootLayer()
-            tracker.probe("base_layer_loaded")
+    With cold set, both input files are evicted from the page cache first so
+    the load reads from disk; otherwise they are served from the cache that
+    ensure_session_cached warmed.
+    """
+    if cold:
+        drop_page_cache(base_scene_path_str, prop_path_str)
 
-            # 3. Add property sublayer
-            root_layer.subLayerPaths.append(prop_path_str)
-            tracker.probe("sublayer_added")
+    with PerformanceTracker(
+        name=f"{format_name} Run {run_index}", verbose=False
+    ) as tracker:
+        # 1. Start probe (baseline)
+        tracker.probe("start")
 
-            # 4. Force composition
-            _ = stage.GetPseudoRoot()
-            tracker.probe("composition_complete")
+        # 2. Open base scene and add the property sublayer (one probe: the
+        #    base layer is the same for every format)
+        stage = Usd.Stage.Open(base_scene_path_str)
+        stage.GetRootLayer().subLayerPaths.append(prop_path_str)
+        tracker.probe("base_and_sublayer_added")
 
-        result_queue.put(tracker.probes)
+        # 3. Force composition
+        _ = stage.GetPseudoRoot()
+        tracker.probe("composition_complete")
 
-    except Exception as e:
-        # Pass exception back to main process
-        result_queue.put(e)
+    return write_probes(_probe_buffer, run_index - 1, tracker.probes, PROBE_LABELS)
 
 
 class TestInitialLoad:
@@ -56,6 +81,7 @@ class TestInitialLoad:
         base_scene_path: Path,
         benchmark_scale: int,
         benchmark_hierarchy: str,
+        benchmark_cache: str,
         result_collector,
     ):
         """Measure time and memory for cold loading property sublayer into stage.
@@ -64,6 +90,7 @@ class TestInitialLoad:
         - Makes 5 independent runs (no warmup)
         - Measures both timing and memory at key points via probes
         - Each run starts fresh with clean USD caches
+        - The OS page cache is warm unless --benchmark-cache=cold is given
         """
         format_name, prop_path = property_file
         collector = result_collector
@@ -74,28 +101,33 @@ class TestInitialLoad:
         all_probe_data = []
 
         print(f"\n{'=' * 70}")
-        print(f"{format_name} cold sublayer load ({num_runs} runs)")
+        print(
+            f"{format_name} cold sublayer load ({num_runs} runs, "
+            f"{benchmark_cache} page cache)"
+        )
         print(f"{'=' * 70}\n")
 
-        for i in range(num_runs):
-            print(f"Run {i + 1}/{num_runs}:")
-
-            # Use multiprocessing to isolate memory and run clean
-            queue = multiprocessing.Queue()
-
-            p = multiprocessing.Process(
-                target=_run_single_iteration,
-                args=(str(base_scene_path), str(prop_path), format_name, i + 1, queue),
+        # A fresh forked worker per run (see isolated_pool); worker errors
+        # re-raise here
+        buffer = probe_buffer(num_runs, PROBE_LABELS)
+        with isolated_pool(initializer=_init_worker, initargs=(buffer,)) as pool:
+            runs = pool.imap(
+                partial(
+                    _run_single_iteration,
+                    str(base_scene_path),
+                    str(prop_path),
+                    format_name,
+                    benchmark_cache == "cold",
+                ),
+                range(1, num_runs + 1),
             )
-            p.start()
 
-            try:
-                # Wait for result (timeout 60s)
-                probes = queue.get(timeout=60)
-                p.join()
+            for i in range(num_runs):
+                print(f"Run {i + 1}/{num_runs}:")
 
-                if isinstance(probes, Exception):
-                    raise probes
+                # Wait for result (timeout 60s)
+                count = runs.next(timeout=60)
+                probes = read_probes(buffer, i, count, PROBE_LABELS)
 
                 if probes:
                     # Calculate results from probes
@@ -105,31 +137,14 @@ class TestInitialLoad:
                     times.append(total_time)
                     memory_peaks.append(total_memory)
 
-                    # Convert probes to dictionary format for storage
-                    run_probes = []
-                    for probe in probes:
-                        run_probes.append(
-                            {
-                                "label": probe.label,
-                                "elapsed_since_start": probe.elapsed_since_start,
-                                "elapsed_since_last": probe.elapsed_since_last,
-                                "total_memory_bytes": probe.total_memory_bytes,
-                                "delta_since_start": probe.delta_since_start,
-                                "delta_since_last": probe.delta_since_last,
-                            }
-                        )
-                    all_probe_data.append(run_probes)
+                    # Keep the ProbeResults; they become dicts only when serialized
+                    all_probe_data.append(probes)
 
                     if i < num_runs - 1:
                         print(
                             f"  Total: {total_time:.4f}s, {total_memory / (1024 * 1024):+.2f} MB\n"
                         )
 
-            except Exception as e:
-                if p.is_alive():
-                    p.terminate()
-                raise e
-
         # Calculate statistics across all runs
         timing = TimingResult.from_times(times)
 
@@ -148,7 +163,10 @@ class TestInitialLoad:
                 hierarchy=benchmark_hierarchy,
                 timing=timing,
                 memory=final_memory,
-                extra={"detailed_probes": all_probe_data},
+                extra={
+                    "page_cache": benchmark_cache,
+                    "detailed_probes": all_probe_data,
+                },
             )
         )
 
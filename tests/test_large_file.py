@@ -37,21 +37,20 @@ def test_large_parquet_file_loading():
     # We generated 1,000,000 rows, so we should expect paths like /World/Sphere0 ... /World/Sphere999999
     # Checking a few random ones.
 
-    print("Checking /World/Sphere0")
-    if not layer.GetPrimAtPath("/World/Sphere0"):
-        print("FAILED to find /World/Sphere0")
-    assert layer.GetPrimAtPath("/World/Sphere0")
-
-    print("Checking /World/Sphere999999")
-    if not layer.GetPrimAtPath("/World/Sphere999999"):
-        print("FAILED to find /World/Sphere999999")
-    assert layer.GetPrimAtPath("/World/Sphere999999")
+    # Paths are parsed once and each prim is looked up only once
+    for path in (Sdf.Path("/World/Sphere0"), Sdf.Path("/World/Sphere999999")):
+        print(f"Checking {path}")
+        prim_spec = layer.GetPrimAtPath(path)
+        if not prim_spec:
+            print(f"FAILED to find {path}")
+        assert prim_spec
 
     # Check a value
-    prim = layer.GetPrimAtPath("/World/Sphere123456")
     # In Sdf, properties are children of the prim.
     # We can check if the property exists in the properties list or use layer.GetPropertyAtPath
-    prop_path = prim.path.AppendProperty("temperature")
+    prim_path = Sdf.Path("/World/Sphere123456")
+    assert layer.GetPrimAtPath(prim_path)
+    prop_path = prim_path.AppendProperty("temperature")
     assert layer.GetPropertyAtPath(prop_path) is not None
 
     # Verify value type (optional, but good sanity check)
@@ -10,6 +10,8 @@ import argparse
 import sys
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 
 def main():
@@ -20,7 +22,14 @@ def main():
     args = parser.parse_args()
 
     try:
-        df = pd.read_parquet(args.path)
+        # Read only the first batch of rows; the shape comes from the footer
+        parquet_file = pq.ParquetFile(args.path)
+        metadata = parquet_file.metadata
+        batch = next(parquet_file.iter_batches(batch_size=max(args.n, 1)), None)
+        head = pa.Table.from_batches(
+            [batch] if batch is not None else [], schema=parquet_file.schema_arrow
+        ).slice(0, args.n)
+        df = head.to_pandas()
 
         # Configure pandas display options for nicer formatting
         pd.set_option("display.max_columns", None)
@@ -28,10 +37,10 @@ def main():
         pd.set_option("display.max_rows", args.n)
 
         print(f"File: {args.path}")
-        print(f"Shape: {df.shape}")
+        print(f"Shape: {(metadata.num_rows, df.shape[1])}")
         print("-" * 40)
         print(f"Displaying top {args.n} rows:")
-        print(df.head(args.n))
+        print(df)
     except Exception as e:
         print(f"Error reading file: {e}", file=sys.stderr)
         sys.exit(1)